@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Size and pixel statistics for the generated icons and screenshots.
+
+Scans the output folders (assets/, the iOS AppIcon set, the Android mipmap-*
+folders and web/) across a process pool and, per image, records:
+
+  bytes            file size (download size)
+  width, height    pixel dimensions
+  decoded_bytes    width × height × 4 – what the image costs once decoded on device
+  colors           unique colours; counted on a nearest-neighbour sample for
+                   images over SAMPLE_PIXELS (colors_estimated is then true)
+  palette_ok       ≤ 256 colours, so the PNG could be palette-encoded
+  alpha_unused     has an alpha channel that is fully opaque
+
+Files over the byte or decoded-memory budget are flagged, and files that
+can't be opened or decoded are listed as unreadable instead of stopping the
+scan. The full report is written as JSON.
+
+Usage:
+  python scripts/asset_report.py [--max-kb 1024] [--max-decoded-mb 24]
+      [--json asset_report.json] [--workers 8]
+"""
+
+from PIL import Image, UnidentifiedImageError
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import time
+
+from asset_targets import BASE_DIR, IOS_ICON_DIR
+
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.webp')
+SAMPLE_PIXELS = 1_000_000
+
+# group → glob patterns relative to BASE_DIR
+SCAN_ROOTS = {
+    'assets': [os.path.join('assets', '**', '*')],
+    'ios': [os.path.join(IOS_ICON_DIR, '*')],
+    'android': [os.path.join('android', 'app', 'src', 'main', 'res', 'mipmap-*', '*')],
+    'web': [os.path.join('web', '**', '*')],
+}
+
+def find_images(base_dir=BASE_DIR, roots=SCAN_ROOTS):
+    """Yield (group, path) for every image under the scanned roots."""
+    for group, patterns in roots.items():
+        for pattern in patterns:
+            for path in sorted(glob.glob(os.path.join(base_dir, pattern), recursive=True)):
+                if path.lower().endswith(IMAGE_EXTS) and os.path.isfile(path):
+                    yield group, path
+
+def count_colors(img):
+    """(unique colours, estimated) – exact up to SAMPLE_PIXELS, sampled above."""
+    w, h = img.size
+    estimated = w * h > SAMPLE_PIXELS
+    if estimated:
+        scale = (SAMPLE_PIXELS / (w * h)) ** 0.5
+        img = img.resize((max(1, int(w * scale)), max(1, int(h * scale))), Image.NEAREST)
+    colors = img.getcolors(img.width * img.height)
+    return len(colors), estimated
+
+def inspect(item):
+    """Statistics for one image file; {'path', 'group', 'error'} if it can't be read."""
+    group, path, base_dir = item
+    try:
+        with Image.open(path) as img:
+            fmt, mode = img.format, img.mode
+            w, h = img.size
+            has_alpha = mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+            img = img.convert('RGBA' if has_alpha else 'RGB')
+            colors, estimated = count_colors(img)
+            alpha_unused = has_alpha and img.getchannel('A').getextrema() == (255, 255)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as e:
+        return {'path': os.path.relpath(path, base_dir), 'group': group,
+                'error': f"{type(e).__name__}: {e}"}
+    return {
+        'path': os.path.relpath(path, base_dir),
+        'group': group,
+        'format': fmt,
+        'mode': mode,
+        'bytes': os.path.getsize(path),
+        'width': w,
+        'height': h,
+        'decoded_bytes': w * h * 4,
+        'colors': colors,
+        'colors_estimated': estimated,
+        'palette_ok': colors <= 256 and not estimated,
+        'alpha_unused': alpha_unused,
+    }
+
+def build_report(max_bytes, max_decoded, workers=None, base_dir=BASE_DIR):
+    """Scan every output image and return the report dict."""
+    items = [(group, path, base_dir) for group, path in find_images(base_dir)]
+    start = time.perf_counter()
+    files = []
+    if items:
+        workers = min(workers or os.cpu_count() or 1, len(items))
+        with multiprocessing.Pool(workers) as pool:
+            files = list(pool.imap_unordered(inspect, items, chunksize=max(1, len(items) // (workers * 4))))
+    files.sort(key=lambda f: f['path'])
+    unreadable = [f for f in files if 'error' in f]
+    files = [f for f in files if 'error' not in f]
+    for f in files:
+        f['flags'] = [flag for flag, hit in (
+            ('over_bytes_budget', max_bytes and f['bytes'] > max_bytes),
+            ('over_decoded_budget', max_decoded and f['decoded_bytes'] > max_decoded),
+            ('palette_ok', f['palette_ok']),
+            ('alpha_unused', f['alpha_unused']),
+        ) if hit]
+    groups = {}
+    for f in files:
+        g = groups.setdefault(f['group'], {'files': 0, 'bytes': 0, 'decoded_bytes': 0})
+        g['files'] += 1
+        g['bytes'] += f['bytes']
+        g['decoded_bytes'] += f['decoded_bytes']
+    return {
+        'budget': {'max_bytes': max_bytes, 'max_decoded_bytes': max_decoded},
+        'scan_seconds': round(time.perf_counter() - start, 3),
+        'totals': {
+            'files': len(files),
+            'bytes': sum(f['bytes'] for f in files),
+            'decoded_bytes': sum(f['decoded_bytes'] for f in files),
+            'over_budget': sum(1 for f in files if any(x.startswith('over_') for x in f['flags'])),
+            'unreadable': len(unreadable),
+        },
+        'groups': groups,
+        'files': files,
+        'unreadable': unreadable,
+    }
+
+def print_report(report):
+    mb = 2 ** 20
+    t = report['totals']
+    print(f"📊 {t['files']} images · {t['bytes'] / mb:.1f} MB on disk · "
+          f"{t['decoded_bytes'] / mb:.1f} MB decoded · scanned in {report['scan_seconds']:.1f}s\n")
+    print(f"  {'group':<8} {'files':>6} {'on disk':>10} {'decoded':>10}")
+    for name, g in report['groups'].items():
+        print(f"  {name:<8} {g['files']:>6} {g['bytes'] / mb:7.2f} MB {g['decoded_bytes'] / mb:7.1f} MB")
+    over = [f for f in report['files'] if any(x.startswith('over_') for x in f['flags'])]
+    if over:
+        print(f"\n⚠️  {len(over)} file(s) over budget:")
+        for f in over:
+            print(f"  {f['path']}  {f['bytes'] / 1024:.0f} KB · {f['width']}×{f['height']} · "
+                  f"{', '.join(x for x in f['flags'] if x.startswith('over_'))}")
+    if report['unreadable']:
+        print(f"\n⚠️  {len(report['unreadable'])} unreadable file(s):")
+        for f in report['unreadable']:
+            print(f"  {f['path']}  {f['error']}")
+    palette = sum(1 for f in report['files'] if f['palette_ok'])
+    alpha = sum(1 for f in report['files'] if f['alpha_unused'])
+    if palette or alpha:
+        print(f"\n  {palette} could be palette-encoded · {alpha} carry an unused alpha channel")
+
+def write_report(report, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Report: {path}")
+
+def run(max_kb=1024, max_decoded_mb=24, json_path=None, workers=None):
+    report = build_report(int(max_kb * 1024) if max_kb else None,
+                          int(max_decoded_mb * 2 ** 20) if max_decoded_mb else None, workers)
+    print_report(report)
+    write_report(report, json_path or os.path.join(BASE_DIR, 'asset_report.json'))
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Report sizes and pixel statistics of generated assets.")
+    parser.add_argument('--max-kb', type=float, default=1024, help="per-file size budget (0 = off)")
+    parser.add_argument('--max-decoded-mb', type=float, default=24,
+                        help="per-file decoded memory budget (0 = off)")
+    parser.add_argument('--json', default=None, help="default: asset_report.json in the project root")
+    parser.add_argument('--workers', type=int, default=None, help="default: all cores")
+    args = parser.parse_args()
+    run(args.max_kb, args.max_decoded_mb, args.json, args.workers)
+
+if __name__ == '__main__':
+    main()
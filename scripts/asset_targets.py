@@ -0,0 +1,103 @@
+"""
+Output targets for the icon and screenshot scripts.
+
+Plain data with no Pillow import, so build plans can be resolved (and
+printed) before any rendering code is loaded.
+"""
+
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IOS_ICON_DIR = os.path.join('ios', 'Runner', 'Assets.xcassets', 'AppIcon.appiconset')
+APP_ICON_DIR = os.path.join('assets', 'app_icon')
+SCREENSHOT_DIR = os.path.join('assets', 'screenshots')
+THEME_DIR = os.path.join('assets', 'themes')
+VARIANT_DIR = os.path.join('assets', 'icon_variants')
+
+# (section, platform, path relative to BASE_DIR, size) in generation order
+ICON_TARGETS = [
+    ('📱 App Store icon', 'store', os.path.join(APP_ICON_DIR, 'app_icon_1024.png'), 1024),
+    ('📱 App Store icon', 'ios', os.path.join(IOS_ICON_DIR, 'Icon-App-1024x1024@1x.png'), 1024),
+] + [
+    ('🍎 iOS icons', 'ios', os.path.join(IOS_ICON_DIR, filename), size)
+    for filename, size in [
+        ('Icon-App-20x20@1x.png', 20),
+        ('Icon-App-20x20@2x.png', 40),
+        ('Icon-App-20x20@3x.png', 60),
+        ('Icon-App-29x29@1x.png', 29),
+        ('Icon-App-29x29@2x.png', 58),
+        ('Icon-App-29x29@3x.png', 87),
+        ('Icon-App-40x40@1x.png', 40),
+        ('Icon-App-40x40@2x.png', 80),
+        ('Icon-App-40x40@3x.png', 120),
+        ('Icon-App-60x60@2x.png', 120),
+        ('Icon-App-60x60@3x.png', 180),
+        ('Icon-App-76x76@1x.png', 76),
+        ('Icon-App-76x76@2x.png', 152),
+        ('Icon-App-83.5x83.5@2x.png', 167),
+    ]
+] + [
+    ('🤖 Android icons', 'android',
+     os.path.join('android', 'app', 'src', 'main', 'res', dir_name, 'ic_launcher.png'), size)
+    for dir_name, size in [
+        ('mipmap-mdpi', 48),
+        ('mipmap-hdpi', 72),
+        ('mipmap-xhdpi', 96),
+        ('mipmap-xxhdpi', 144),
+        ('mipmap-xxxhdpi', 192),
+    ]
+] + [
+    ('🌐 Web icons', 'web', os.path.join('web', 'icons', 'Icon-192.png'), 192),
+    ('🌐 Web icons', 'web', os.path.join('web', 'icons', 'Icon-512.png'), 512),
+    ('🌐 Web icons', 'web', os.path.join('web', 'favicon.png'), 16),
+    ('🏪 Store icons', 'store', os.path.join(APP_ICON_DIR, 'play_store_512.png'), 512),
+]
+
+ICON_PLATFORMS = sorted({platform for _, platform, _, _ in ICON_TARGETS})
+
+def themed_path(theme, rel_path):
+    """Where a theme variant of a target goes: assets/themes/<theme>/<rel_path>."""
+    return os.path.join(THEME_DIR, theme, rel_path)
+
+def variant_path(variant, rel_path):
+    """Where an icon variant of a target goes: assets/icon_variants/<variant>/<rel_path>."""
+    return os.path.join(VARIANT_DIR, variant, rel_path)
+
+def icon_render_size(size):
+    """Icons are drawn at 2x (at least 1024px) and downscaled."""
+    return max(size * 2, 1024)
+
+def fitted_render_size(size, max_bytes):
+    """Largest render size up to icon_render_size(size) whose low-memory peak fits max_bytes.
+
+    Building a master holds the field (1 B/px) and the RGB master (3 B/px);
+    a downscaled target adds its RGB output plus the resize's intermediate
+    pass. Raises MemoryError if even an unsupersampled render doesn't fit.
+    """
+    r = icon_render_size(size)
+    need = lambda r: max(4 * r * r, 3 * r * r + 3 * size * r + 3 * size * size)
+    while r > size and need(r) > max_bytes:
+        r -= max(1, r // 16)
+    r = max(r, size)
+    if 4 * r * r > max_bytes:
+        raise MemoryError(f"{size}x{size} icon needs {4 * r * r / 2**20:.1f} MB, "
+                          f"over the {max_bytes / 2**20:.1f} MB ceiling")
+    return r
+
+# ── App Store required sizes ────────────────────────────────
+SCREENSHOT_SIZES = {
+    'iphone_67': (1290, 2796),   # iPhone 6.7" – REQUIRED
+    'iphone_65': (1284, 2778),   # iPhone 6.5"
+    'ipad_13':   (2064, 2752),   # iPad 13"    – REQUIRED
+}
+
+# File names of generate_screenshots.SCREENS, in AIDA order
+SCREENSHOT_NAMES = [
+    '01_home',
+    '02_countdown',
+    '03_reminders',
+    '04_import',
+    '05_gifts',
+    '06_relations',
+]
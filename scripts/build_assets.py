@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Selective icon / screenshot builds.
+
+Resolves a build plan from the selectors first, prints it with estimated
+costs, and only then imports the rendering code the plan actually needs –
+a favicon rebuild never loads the screenshot module, and a dry run never
+loads Pillow at all. Icons that share a size are rendered once and copied.
+
+Usage:
+  python scripts/build_assets.py icons [--platform ios] [--size 120 ...]
+  python scripts/build_assets.py screenshots [--device ipad_13] [--screen 03_reminders ...]
+  python scripts/build_assets.py all
+  add --theme dark (repeatable) to render theme variants into assets/themes/<theme>/
+  add --dry-run to print the plan without rendering
+  add --low-memory (or --max-mb 64) to icons/all to render icons, themed ones too, under a memory ceiling
+  add --report to write a size / pixel-statistics report after the build
+  add --check-estimates to build into a temporary directory and compare the
+    plan's estimated times with the measured ones
+  python scripts/build_assets.py report [--max-kb 1024] [--max-decoded-mb 24]
+"""
+
+from collections import namedtuple
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from asset_targets import (
+    BASE_DIR, SCREENSHOT_DIR, ICON_TARGETS, ICON_PLATFORMS, SCREENSHOT_SIZES,
+    SCREENSHOT_NAMES, icon_render_size, fitted_render_size, themed_path,
+)
+from themes import THEME_NAMES
+
+# Rough single-core costs measured on the reference machine; re-measure with
+# --check-estimates after changing a renderer.
+ICON_SEC_PER_MPX = 0.05   # per megapixel of the 2x render canvas (palette gradient + cake)
+SHOT_SEC_PER_MPX = 0.06   # per megapixel of the output screenshot
+THEMED_ICON_SEC_PER_MPX = 0.04   # per theme, gradient from a cached progress field
+LOW_MEM_ICON_SEC_PER_MPX = 0.08  # per master, shared by every size with the same render size
+LOW_MEM_RESIZE_SEC_PER_MPX = 0.02  # per target, downscale from the master and encode
+THEMED_SHOT_FRACTION = 0.9       # extra themes: background + mask pastes (~½ render) + full encode
+
+# kind: 'icon' | 'screenshot'; key: icon size or (device, screen name);
+# theme: None for the regular assets
+Step = namedtuple('Step', 'kind key outputs cost theme', defaults=(None,))
+
+# ── Planning (no rendering imports) ────────────────────────
+
+def plan_icons(platforms=None, sizes=None, themes=None, low_memory=False, max_bytes=None):
+    """One step per distinct icon size (and theme) among the selected targets.
+
+    With low_memory the steps are ordered by theme and render size, so
+    targets that share a master are rendered back to back and only the
+    first pays for building it; every target pays for its downscale.
+    max_bytes lowers render sizes as the renderer will (MemoryError if a
+    target can't fit).
+    """
+    by_size = {}
+    for _, platform, rel_path, size in ICON_TARGETS:
+        if platforms and platform not in platforms:
+            continue
+        if sizes and size not in sizes:
+            continue
+        by_size.setdefault(size, []).append(rel_path)
+    if low_memory:
+        render_size = icon_render_size
+        if max_bytes:
+            render_size = lambda size: fitted_render_size(size, max_bytes)
+        steps, seen = [], set()
+        for theme in themes or [None]:
+            for size in sorted(by_size, key=render_size, reverse=True):
+                r = render_size(size)
+                cost = r * r / 1e6 * LOW_MEM_RESIZE_SEC_PER_MPX
+                if (r, theme) not in seen:
+                    cost += r * r / 1e6 * LOW_MEM_ICON_SEC_PER_MPX
+                seen.add((r, theme))
+                paths = [themed_path(theme, p) if theme else p for p in by_size[size]]
+                steps.append(Step('icon', size, [os.path.join(BASE_DIR, p) for p in paths], cost, theme))
+        return steps
+    if not themes:
+        return [Step('icon', size, [os.path.join(BASE_DIR, p) for p in paths],
+                     icon_render_size(size) ** 2 / 1e6 * ICON_SEC_PER_MPX)
+                for size, paths in by_size.items()]
+    return [Step('icon', size, [os.path.join(BASE_DIR, themed_path(theme, p)) for p in paths],
+                 icon_render_size(size) ** 2 / 1e6 * THEMED_ICON_SEC_PER_MPX, theme)
+            for size, paths in by_size.items() for theme in themes]
+
+def plan_screenshots(devices=None, screens=None, themes=None):
+    steps = []
+    for device, (w, h) in SCREENSHOT_SIZES.items():
+        if devices and device not in devices:
+            continue
+        for name in SCREENSHOT_NAMES:
+            if screens and not any(name == s or name[3:] == s for s in screens):
+                continue
+            rel_path = os.path.join(SCREENSHOT_DIR, device, f"{name}.png")
+            cost = w * h / 1e6 * SHOT_SEC_PER_MPX
+            if not themes:
+                steps.append(Step('screenshot', (device, name), [os.path.join(BASE_DIR, rel_path)], cost))
+                continue
+            for i, theme in enumerate(themes):
+                steps.append(Step('screenshot', (device, name),
+                                  [os.path.join(BASE_DIR, themed_path(theme, rel_path))],
+                                  cost * (THEMED_SHOT_FRACTION if i else 1.0), theme))
+    return steps
+
+def print_plan(steps):
+    total = sum(s.cost for s in steps)
+    files = sum(len(s.outputs) for s in steps)
+    print(f"📋 Build plan: {len(steps)} render(s), {files} file(s), ≈ {total:.1f}s\n")
+    for s in steps:
+        if s.kind == 'icon':
+            what = f"{s.key}×{s.key}"
+            extra = f" (+{len(s.outputs) - 1} copies)" if len(s.outputs) > 1 else ""
+        else:
+            what = '/'.join(s.key)
+            extra = ""
+        if s.theme:
+            what = f"{what} [{s.theme}]"
+        print(f"  {s.kind:<10}  {what:<24}  ≈ {s.cost:5.2f}s{extra}")
+    print()
+
+# ── Execution (imports on demand) ──────────────────────────
+
+def _by_key(steps):
+    """{key: {theme: step}} for themed steps, keeping plan order."""
+    grouped = {}
+    for s in steps:
+        grouped.setdefault(s.key, {})[s.theme] = s
+    return grouped
+
+def _save_all(img, paths):
+    from render_core.output import save_copies
+    for path in save_copies(img, paths):
+        print(f"  ✓ {img.width}×{img.height}  {os.path.relpath(path, BASE_DIR)}")
+
+def _render_icon(render, step):
+    first, *copies = step.outputs
+    for path in step.outputs:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    render(step.key, first)
+    for path in copies:
+        shutil.copyfile(first, path)
+        print(f"  ↳ {path}")
+
+def run_plan(steps, low_memory=False, max_mb=None):
+    """Render the plan; return [(step, seconds)] in render order.
+
+    A step's time starts after its phase's imports, so it can be compared
+    with the step's estimated cost.
+    """
+    icon_steps = [s for s in steps if s.kind == 'icon' and not s.theme]
+    shot_steps = [s for s in steps if s.kind == 'screenshot' and not s.theme]
+    themed_icons = _by_key(s for s in steps if s.kind == 'icon' and s.theme)
+    themed_shots = _by_key(s for s in steps if s.kind == 'screenshot' and s.theme)
+    low_memory = low_memory or bool(max_mb)
+    max_bytes = int(max_mb * 2**20) if max_mb else None
+    mode = f" (low memory{f', ceiling {max_mb:g} MB' if max_mb else ''})" if low_memory else ""
+    start = mark = time.perf_counter()
+    timings = []
+
+    def started():
+        nonlocal mark
+        mark = time.perf_counter()
+
+    def finished(step):
+        nonlocal mark
+        now = time.perf_counter()
+        timings.append((step, now - mark))
+        mark = now
+
+    if icon_steps:
+        from generate_app_icon import generate_icon, LowMemoryIcons
+        render = LowMemoryIcons(max_bytes).render if low_memory else generate_icon
+        print(f"🎂 Icons{mode}:")
+        started()
+        for step in icon_steps:
+            _render_icon(render, step)
+            finished(step)
+
+    if shot_steps:
+        from generate_screenshots import SCREENS, create_screenshot
+        screens = {row[-1]: row for row in SCREENS}
+        print("📸 Screenshots:")
+        started()
+        for step in shot_steps:
+            device, name = step.key
+            headline, subline, func, c1, c2, c3, _ = screens[name]
+            w, h = SCREENSHOT_SIZES[device]
+            out = step.outputs[0]
+            os.makedirs(os.path.dirname(out), exist_ok=True)
+            create_screenshot(w, h, headline, subline, func, c1, c2, c3, out)
+            finished(step)
+
+    if themed_icons and low_memory:
+        from generate_app_icon import LowMemoryIcons
+        print(f"🎨 Themed icons{mode}:")
+        renderer = None
+        started()
+        for step in (s for s in steps if s.kind == 'icon' and s.theme):
+            if renderer is None or renderer.theme != step.theme:
+                renderer = LowMemoryIcons(max_bytes, step.theme)   # drops the previous master
+            _render_icon(renderer.render, step)
+            finished(step)
+    elif themed_icons:
+        from generate_app_icon import render_icon_themes
+        print("🎨 Themed icons:")
+        started()
+        for size, by_theme in themed_icons.items():
+            for theme, img in render_icon_themes(size, list(by_theme)):
+                _save_all(img, by_theme[theme].outputs)
+                finished(by_theme[theme])
+
+    if themed_shots:
+        from generate_screenshots import SCREENS, render_screenshot_themes
+        screens = {row[-1]: row for row in SCREENS}
+        print("🎨 Themed screenshots:")
+        started()
+        for (device, name), by_theme in themed_shots.items():
+            headline, subline, func, c1, c2, c3, _ = screens[name]
+            w, h = SCREENSHOT_SIZES[device]
+            for theme, img in render_screenshot_themes(w, h, headline, subline, func, c1, c2, c3,
+                                                       list(by_theme)):
+                _save_all(img, by_theme[theme].outputs)
+                finished(by_theme[theme])
+
+    print(f"\n✅ Done in {time.perf_counter() - start:.1f}s")
+    return timings
+
+def check_estimates(timings, tolerance=2.0):
+    """Print estimated vs measured seconds per kind of step; True if all are within tolerance×."""
+    groups = {}
+    for step, seconds in timings:
+        label = f"themed {step.kind}s" if step.theme else f"{step.kind}s"
+        g = groups.setdefault(label, [0, 0.0, 0.0])
+        g[0] += 1
+        g[1] += step.cost
+        g[2] += seconds
+    print(f"\n🔎 Estimated vs measured\n")
+    print(f"  {'':<20} {'steps':>6} {'estimated':>10} {'measured':>10} {'ratio':>7}")
+    ok = True
+    for label, (count, estimated, measured) in groups.items():
+        ratio = measured / estimated if estimated else float('inf')
+        within = 1 / tolerance <= ratio <= tolerance
+        ok = ok and within
+        print(f"  {label:<20} {count:>6} {estimated:9.2f}s {measured:9.2f}s {ratio:6.2f}×"
+              + ("" if within else f"  ⚠️  off by more than {tolerance:g}×"))
+    return ok
+
+def main():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--dry-run', action='store_true', help="print the plan and exit")
+    common.add_argument('--report', action='store_true', help="write asset_report.json after the build")
+    common.add_argument('--check-estimates', action='store_true',
+                        help="build into a temporary directory and compare estimated with measured times")
+    parser = argparse.ArgumentParser(description="Build selected app icons and screenshots.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    icons = sub.add_parser('icons', parents=[common], help="app / store / web icons")
+    icons.add_argument('--platform', action='append', choices=ICON_PLATFORMS)
+    icons.add_argument('--size', action='append', type=int)
+    icons.add_argument('--theme', action='append', choices=THEME_NAMES)
+
+    shots = sub.add_parser('screenshots', parents=[common], help="App Store screenshots")
+    shots.add_argument('--device', action='append', choices=sorted(SCREENSHOT_SIZES))
+    shots.add_argument('--screen', action='append',
+                       help=f"one of {', '.join(SCREENSHOT_NAMES)} (prefix optional)")
+    shots.add_argument('--theme', action='append', choices=THEME_NAMES)
+
+    every = sub.add_parser('all', parents=[common], help="every icon and screenshot")
+    every.add_argument('--theme', action='append', choices=THEME_NAMES)
+    for p in (icons, every):
+        p.add_argument('--low-memory', action='store_true',
+                       help="one shared canvas per render size, peak memory per icon")
+        p.add_argument('--max-mb', type=float, default=None,
+                       help="memory ceiling per icon (implies --low-memory)")
+
+    report = sub.add_parser('report', help="size / pixel statistics of the generated assets")
+    report.add_argument('--max-kb', type=float, default=1024, help="per-file size budget (0 = off)")
+    report.add_argument('--max-decoded-mb', type=float, default=24, help="per-file decoded budget (0 = off)")
+    report.add_argument('--json', default=None)
+    args = parser.parse_args()
+
+    if args.command == 'report':
+        import asset_report
+        asset_report.run(args.max_kb, args.max_decoded_mb, args.json)
+        return
+
+    max_mb = getattr(args, 'max_mb', None)
+    low_memory = getattr(args, 'low_memory', False) or max_mb is not None
+
+    steps = []
+    if args.command in ('icons', 'all'):
+        try:
+            steps += plan_icons(getattr(args, 'platform', None), getattr(args, 'size', None), args.theme,
+                                low_memory, int(max_mb * 2**20) if max_mb else None)
+        except MemoryError as e:
+            parser.error(f"--max-mb {max_mb:g} is too small: {e}")
+    if args.command in ('screenshots', 'all'):
+        steps += plan_screenshots(getattr(args, 'device', None), getattr(args, 'screen', None), args.theme)
+    if not steps:
+        sys.exit("Nothing matches those selectors.")
+
+    print_plan(steps)
+    if args.check_estimates and not args.dry_run:
+        with tempfile.TemporaryDirectory() as tmp:
+            steps = [s._replace(outputs=[os.path.join(tmp, os.path.relpath(p, BASE_DIR)) for p in s.outputs])
+                     for s in steps]
+            timings = run_plan(steps, low_memory, max_mb)
+        if not check_estimates(timings):
+            sys.exit("\nEstimates are off – recalibrate the cost constants at the top of build_assets.py.")
+    elif not args.dry_run:
+        run_plan(steps, low_memory, max_mb)
+        if args.report:
+            import asset_report
+            print()
+            asset_report.run()
+
+if __name__ == '__main__':
+    main()
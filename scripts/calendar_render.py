@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Month / year birthday calendars for any date range.
+
+The month grid comes from the standard library (weeks start on Monday), and
+everything that does not depend on the month is rendered once per size and
+reused: the weekday header is a cached coverage mask, and day numbers are
+cached glyph masks stamped with `draw.bitmap`. Per month only the title, the
+day numbers and the birthday markers are drawn.
+
+Usage:
+  python scripts/calendar_render.py contacts.csv [more.csv ...] --year 2026
+      [--month 2] [--size 1600x2000] [--out-dir out/]
+"""
+
+from PIL import Image, ImageDraw
+from functools import lru_cache
+import argparse
+import calendar
+import datetime
+import os
+
+from render_core.palette import WHITE, DARK, LIGHT_BG
+from render_core.text import load_font
+from render_core.cli import parse_size
+from contacts import read_contacts, parse_birthday, avatar_color
+
+MONTHS = ["Januari", "Februari", "Mars", "April", "Maj", "Juni",
+          "Juli", "Augusti", "September", "Oktober", "November", "December"]
+WEEKDAYS = ["Mån", "Tis", "Ons", "Tor", "Fre", "Lör", "Sön"]
+HEADER_GREY = (150, 150, 160)
+
+@lru_cache(maxsize=None)
+def month_grid(year, month):
+    """(column of the 1st, number of days) – Monday is column 0."""
+    return calendar.monthrange(year, month)
+
+def month_block_height(cell_h):
+    """Height of one month: title, weekday header and six week rows."""
+    return int(cell_h * 1.08) + int(cell_h * 0.46) + cell_h * 6
+
+@lru_cache(maxsize=None)
+def weekday_header(cell_w, font_px):
+    """Weekday labels as a single coverage mask, built once per size."""
+    font = load_font(font_px)
+    mask = Image.new('L', (cell_w * 7, font_px * 2), 0)
+    draw = ImageDraw.Draw(mask)
+    for i, d in enumerate(WEEKDAYS):
+        draw.text((i * cell_w + cell_w // 4, 0), d, fill=255, font=font)
+    return mask
+
+@lru_cache(maxsize=None)
+def day_sprite(day, font_px):
+    """(mask, (dx, dy)) for a day number, rasterized once per size."""
+    font = load_font(font_px)
+    left, top, right, bottom = font.getbbox(str(day))
+    mask = Image.new('L', (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), str(day), fill=255, font=font)
+    return mask, (left, top)
+
+def birthdays_by_month(entries, year):
+    """{month: {day: colour}} in year from contact dicts with name and birthday.
+
+    29 February falls on the 28th in non-leap years, as in next_birthday.
+    Entries without a readable name, birthday or colour are skipped.
+    """
+    months = {}
+    for e in entries:
+        try:
+            name = e['name'].strip()
+            _, month, day = parse_birthday(e['birthday'])
+            color = tuple(e['color']) if e.get('color') else avatar_color(name)
+        except (KeyError, ValueError, TypeError, AttributeError):
+            continue
+        if not name:
+            continue
+        if (month, day) == (2, 29) and not calendar.isleap(year):
+            day = 28
+        months.setdefault(month, {}).setdefault(day, color)
+    return months
+
+def draw_month(draw, x, y, w, cell_h, year, month, marks=None, today=None,
+               title_px=None, day_px=None):
+    """Draw one month at (x, y) with width w; marks is {day: colour}.
+
+    Today gets a dark ring around its cell, so a birthday marker on the same
+    day stays visible.
+    """
+    marks = marks or {}
+    cell_w = w // 7
+    title_px = title_px or int(cell_h * 0.54)
+    day_px = day_px or int(cell_h * 0.215)
+
+    draw.text((x + int(w * 0.06), y), f"{MONTHS[month - 1]} {year}", fill=DARK, font=load_font(title_px))
+    grid_y = y + int(cell_h * 1.08)
+    draw.bitmap((x, grid_y), weekday_header(cell_w, day_px), fill=HEADER_GREY)
+    grid_y += int(cell_h * 0.46)
+
+    start_col, ndays = month_grid(year, month)
+    r = int(cell_w * 0.35)
+    for day in range(1, ndays + 1):
+        row, col = divmod(start_col + day - 1, 7)
+        cx = x + col * cell_w + cell_w // 2
+        cy = grid_y + row * cell_h + cell_h // 2
+        marker = marks.get(day)
+        if marker:
+            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=marker)
+        if day == today:
+            ring = r + max(2, r // 5)
+            draw.ellipse([cx - ring, cy - ring, cx + ring, cy + ring], outline=DARK,
+                         width=max(2, r // 8))
+        mask, (dx, dy) = day_sprite(day, day_px)
+        draw.bitmap((cx - int(r * 0.4) + dx, cy - int(r * 0.5) + dy), mask,
+                    fill=WHITE if marker else DARK)
+
+def render_year(year, months, size=(1600, 2000), today=None, bg=LIGHT_BG):
+    """All 12 months of one calendar in a 3×4 grid on a single image."""
+    w, h = size
+    img = Image.new('RGB', size, bg)
+    draw = ImageDraw.Draw(img, 'RGBA')
+    margin = int(w * 0.03)
+    col_w = (w - margin * 4) // 3
+    cell_h = (h - margin * 5) // 4 * 100 // month_block_height(100)
+    for i in range(12):
+        row, col = divmod(i, 3)
+        mx = margin + col * (col_w + margin)
+        my = margin + row * (month_block_height(cell_h) + margin)
+        t = today.day if today and (today.year, today.month) == (year, i + 1) else None
+        draw_month(draw, mx, my, col_w, cell_h, year, i + 1, months.get(i + 1), t)
+    return img
+
+def render_month(year, month, marks, size=(1290, 1400), today=None, bg=LIGHT_BG):
+    w, h = size
+    img = Image.new('RGB', size, bg)
+    draw = ImageDraw.Draw(img, 'RGBA')
+    margin = int(w * 0.04)
+    cell_h = (h - margin * 2) * 100 // month_block_height(100)
+    draw_month(draw, margin, margin, w - margin * 2, cell_h, year, month, marks, today)
+    return img
+
+def render_calendars(sources, year, month=None, size=(1600, 2000), today=None):
+    """Yield (source, image) for many users' calendars in one pass.
+
+    Header masks and day sprites are shared across every calendar of the
+    same size, so each extra calendar only pays for its own markers.
+    """
+    for source, entries in sources:
+        months = birthdays_by_month(entries, year)
+        if month:
+            t = today.day if today and (today.year, today.month) == (year, month) else None
+            yield source, render_month(year, month, months.get(month), size, t)
+        else:
+            yield source, render_year(year, months, size, today)
+
+def main():
+    parser = argparse.ArgumentParser(description="Render birthday calendars.")
+    parser.add_argument('contacts', nargs='+', help="CSV or JSONL files, one calendar each")
+    parser.add_argument('--year', type=int, default=datetime.date.today().year)
+    parser.add_argument('--month', type=int, choices=range(1, 13), default=None,
+                        help="render a single month instead of the whole year")
+    parser.add_argument('--size', type=parse_size, default=None)
+    parser.add_argument('--out-dir', default='.')
+    args = parser.parse_args()
+
+    size = args.size or ((1290, 1400) if args.month else (1600, 2000))
+    os.makedirs(args.out_dir, exist_ok=True)
+    sources = ((path, read_contacts(path)) for path in args.contacts)
+    suffix = f"{args.year}-{args.month:02d}" if args.month else str(args.year)
+    print(f"📅 Rendering {len(args.contacts)} calendar(s) for {suffix}\n")
+    for path, img in render_calendars(sources, args.year, args.month, size, datetime.date.today()):
+        name = os.path.splitext(os.path.basename(path))[0]
+        out = os.path.join(args.out_dir, f"calendar_{name}_{suffix}.png")
+        img.save(out, 'PNG')
+        print(f"  ✓ {size[0]}×{size[1]}  {os.path.basename(out)}")
+
+if __name__ == '__main__':
+    main()
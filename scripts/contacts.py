@@ -0,0 +1,74 @@
+"""
+Contact records shared by the share-card, calendar and list renderers.
+
+Reading, birthday parsing and the per-name avatar colour. No Pillow import.
+
+Input columns / keys:
+  name      – required
+  birthday  – YYYY-MM-DD (or MM-DD when the year is unknown)
+  age       – optional, overrides the age computed from birthday
+"""
+
+import csv
+import datetime
+import json
+import zlib
+
+from render_core.palette import VIOLET, SKY, MINT2, CORAL, PEACH, GOLD
+
+MONTHS = ["januari", "februari", "mars", "april", "maj", "juni",
+          "juli", "augusti", "september", "oktober", "november", "december"]
+
+AVATAR_COLORS = [CORAL, VIOLET, SKY, MINT2, PEACH, GOLD]
+
+def read_contacts(path):
+    """Yield contact dicts one at a time from a .csv or .jsonl file.
+
+    A JSONL line that doesn't parse is yielded as its JSONDecodeError, so
+    callers skip it in place like any other malformed record.
+    """
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield e
+        else:
+            yield from csv.DictReader(f)
+
+def parse_birthday(value):
+    """Return (year or None, month, day) from 'YYYY-MM-DD' or 'MM-DD'."""
+    parts = [int(p) for p in value.strip().lstrip('-').split('-')]
+    if len(parts) == 3:
+        return parts[0], parts[1], parts[2]
+    return None, parts[0], parts[1]
+
+def next_birthday(month, day, today):
+    """Next occurrence of month/day on or after today (29 feb → 28 feb)."""
+    for year in (today.year, today.year + 1):
+        try:
+            d = datetime.date(year, month, day)
+        except ValueError:
+            d = datetime.date(year, month, 28)
+        if d >= today:
+            return d
+
+def card_fields(record, today):
+    """Resolve the name, age and date line for one contact record."""
+    name = record['name'].strip()
+    year, month, day = parse_birthday(record['birthday'])
+    when = next_birthday(month, day, today)
+    age = record.get('age')
+    if age not in (None, ''):
+        age = int(age)
+    elif year is not None:
+        age = when.year - year
+    else:
+        age = None
+    return name, age, f"{when.day} {MONTHS[when.month - 1]}"
+
+def avatar_color(name):
+    return AVATAR_COLORS[zlib.crc32(name.encode('utf-8')) % len(AVATAR_COLORS)]
@@ -4,31 +4,33 @@ Generate Birthday Reminder app icon in all required sizes.
 Uses the app's aurora gradient (violet → sky → mint) with a birthday cake symbol.
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import math
+from functools import lru_cache
 import os
+import warnings
 
-def lerp_color(c1, c2, t):
-    """Linearly interpolate between two RGB colors."""
-    return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3))
+import render_core as core
+from asset_targets import (
+    BASE_DIR, APP_ICON_DIR, IOS_ICON_DIR, ICON_TARGETS, icon_render_size, fitted_render_size,
+)
+from render_core.palette import AURORA, VIOLET, SKY, MINT, CORAL, PEACH, WHITE
+from render_core.output import save_png
 
-def draw_aurora_gradient(draw, size):
-    """Draw the app's aurora gradient: violet → sky → mint (diagonal)."""
-    violet = (124, 92, 252)   # #7C5CFC
-    sky = (103, 195, 243)     # #67C3F3
-    mint = (110, 231, 183)    # #6EE7B7
-    
-    for y in range(size):
-        for x in range(size):
-            # Diagonal progress
-            t = (x / size * 0.6 + y / size * 0.4)
-            if t < 0.5:
-                color = lerp_color(violet, sky, t * 2)
-            else:
-                color = lerp_color(sky, mint, (t - 0.5) * 2)
-            draw.point((x, y), fill=color)
-
-def draw_cake(draw, size):
+# Base colours of the icon, named as in the screenshot palette for theming
+ICON_PALETTE = {
+    'VIOLET': VIOLET, 'SKY': SKY, 'MINT': MINT, 'CORAL': CORAL, 'PEACH': PEACH, 'WHITE': WHITE,
+}
+
+def aurora_gradient(size, stops=AURORA):
+    """The app's aurora gradient, violet → sky → mint (diagonal), as an RGBA canvas."""
+    return core.colorize(core.diagonal_field(size), stops).convert('RGBA')
+
+CANDLE_COLORS = (
+    (255, 176, 136, 230),  # peach #FFB088
+    (255, 255, 255, 240),  # white
+    (167, 139, 250, 230),  # light violet #A78BFA
+)
+
+def draw_cake(draw, size, candle_colors=CANDLE_COLORS, candles=3):
     """Draw a minimalist birthday cake icon."""
     cx = size // 2
     cy = size // 2 + size // 20
@@ -70,12 +72,8 @@ def draw_cake(draw, size):
     # Candles
     candle_w = int(18 * s)
     candle_h = int(100 * s)
-    candle_colors = [
-        (255, 176, 136, 230),  # peach #FFB088
-        (255, 255, 255, 240),  # white
-        (167, 139, 250, 230),  # light violet #A78BFA
-    ]
-    candle_positions = [cx - int(90 * s), cx, cx + int(90 * s)]
+    spacing = 90 if candles <= 4 else 300 / (candles - 1)
+    candle_positions = [cx + int((i - (candles - 1) / 2) * spacing * s) for i in range(candles)]
     
     for i, pos in enumerate(candle_positions):
         candle_top = cake_top - candle_h
@@ -122,105 +120,195 @@ def draw_cake(draw, size):
 def generate_icon(size, output_path):
     """Generate a single icon at the given size."""
     # Create at 2x for quality, then downscale
-    render_size = max(size * 2, 1024)
-    
-    img = Image.new('RGBA', (render_size, render_size), (255, 255, 255, 255))
-    draw = ImageDraw.Draw(img)
+    from PIL import Image
+    render_size = icon_render_size(size)
     
-    # Draw gradient background
-    draw_aurora_gradient(draw, render_size)
+    # Gradient background
+    img = aurora_gradient(render_size)
     
     # Draw cake
-    draw_cake(draw, render_size)
+    draw_cake(core.canvas_draw(img, blend=False), render_size)
     
     # Downscale with high quality
     if render_size != size:
         img = img.resize((size, size), Image.LANCZOS)
     
     # Convert to RGB (no alpha channel) – required by Apple App Store
-    img_rgb = Image.new('RGB', img.size, (255, 255, 255))
-    img_rgb.paste(img, mask=img.split()[3] if img.mode == 'RGBA' else None)
+    img_rgb = core.flatten(img)
     
     # Save
-    img_rgb.save(output_path, 'PNG')
+    save_png(img_rgb, output_path)
     print(f"  ✓ {size}x{size} → {output_path}")
 
+@lru_cache(maxsize=None)
+def _icon_layout_ops(render_size):
+    """Recorded cake geometry for one render size."""
+    from themes import RecordingDraw
+    rec = RecordingDraw(None)
+    draw_cake(rec, render_size)
+    return rec.ops
+
+@lru_cache(maxsize=None)
+def icon_layout(render_size):
+    """Gradient progress field and recorded cake geometry – shared by all themes and variants."""
+    return core.diagonal_field(render_size), _icon_layout_ops(render_size)
+
+@lru_cache(maxsize=None)
+def themed_master(render_size, theme_name):
+    """Full-size RGBA icon for one theme, before downscaling."""
+    from themes import THEMES, make_resolver, background_stops, replay
+    field, cake_ops = icon_layout(render_size)
+    theme = THEMES[theme_name]
+    resolve = make_resolver(theme, ICON_PALETTE, surfaces=False)
+    img = core.colorize(field, background_stops(theme, AURORA, resolve)).convert('RGBA')
+    replay(cake_ops, core.canvas_draw(img, blend=False), resolve)
+    return img
+
+def render_icon_themes(size, themes):
+    """Yield (theme, RGB icon) per theme; layout is computed once per render size."""
+    from PIL import Image
+    render_size = icon_render_size(size)
+    for name in themes:
+        img = themed_master(render_size, name)
+        if render_size != size:
+            img = img.resize((size, size), Image.LANCZOS)
+        yield name, core.flatten(img)
+
+@lru_cache(maxsize=None)
+def cake_layer(render_size, candle_colors=CANDLE_COLORS, candles=3):
+    """(cake flattened onto white, coverage mask) – shared by every background.
+
+    Cake fills replace the canvas pixels, as on the RGBA icon canvas, so the
+    coverage is exactly where the cake was drawn.
+    """
+    img, draw = core.new_canvas((render_size, render_size), (0, 0, 0, 0), 'RGBA', blend=False)
+    draw_cake(draw, render_size, candle_colors, candles)
+    return core.flatten(img), img.getchannel('A').point(lambda a: 255 if a else 0)
+
+def variant_master(render_size, stops=AURORA, candle_colors=CANDLE_COLORS, candles=3):
+    """Flattened RGB icon for one gradient / cake combination, before downscaling."""
+    img = core.colorize(icon_layout(render_size)[0], stops)
+    flat, coverage = cake_layer(render_size, candle_colors, candles)
+    img.paste(flat, mask=coverage)
+    return img
+
+class LowMemoryIcons:
+    """Icon renderer that keeps at most one full-size canvas alive.
+
+    The master is built once per render size and shared by every target at
+    that size. It holds the gradient and the cake, with the cake's alpha
+    already flattened onto white. The gradient is drawn row by row into a
+    single-band progress field, then turned into RGB through its palette.
+    There is no RGBA canvas, alpha split or second full-size copy.
+
+    Bytes of every live canvas are tracked, so each target reports its peak
+    allocation. With max_bytes set, supersampling is reduced until a target
+    fits under the ceiling. With a theme, the gradient stops and cake colours
+    are resolved as in themed_master.
+    """
+
+    def __init__(self, max_bytes=None, theme=None):
+        self.max_bytes = max_bytes
+        self.theme = theme
+        self.live = {}
+        self.peak = 0
+        self._master = None
+        self._master_size = None
+
+    def _track(self, img):
+        self.live[id(img)] = img.width * img.height * len(img.getbands())
+        self.peak = max(self.peak, sum(self.live.values()))
+        return img
+
+    def _release(self, img):
+        self.live.pop(id(img), None)
+
+    def _transient(self, nbytes):
+        self.peak = max(self.peak, sum(self.live.values()) + nbytes)
+
+    def render_size_for(self, size):
+        """Supersampled size for a target, reduced if needed to fit max_bytes.
+
+        Warns when the ceiling costs quality: less supersampling, or none.
+        """
+        full = icon_render_size(size)
+        if self.max_bytes is None:
+            return full
+        r = fitted_render_size(size, self.max_bytes)
+        if r < full:
+            how = "without supersampling" if r == size else f"at {r}px instead of {full}px"
+            warnings.warn(f"{size}x{size} icon rendered {how} to fit the "
+                          f"{self.max_bytes / 2**20:g} MB ceiling; edges will be rougher",
+                          stacklevel=2)
+        return r
+
+    def master(self, r):
+        if self._master_size == r:
+            return self._master
+        if self._master is not None:
+            self._release(self._master)
+            self._master = self._master_size = None
+
+        from PIL import Image
+        from themes import THEMES, make_resolver, background_stops, replay
+        stops, resolve = AURORA, None
+        if self.theme:
+            theme = THEMES[self.theme]
+            resolve = make_resolver(theme, ICON_PALETTE, surfaces=False)
+            stops = background_stops(theme, AURORA, resolve)
+
+        xs = Image.new('L', (r, 1))
+        xs.putdata([round(x / r * 0.6 * 255) for x in range(r)])
+        field = self._track(Image.new('L', (r, r)))
+        luts = {}
+        for y in range(r):
+            a = round(y / r * 0.4 * 255)
+            if a not in luts:
+                luts[a] = [min(255, v + a) for v in range(256)]
+            field.paste(xs.point(luts[a]), (0, y))
+        field.putpalette(core.gradient_palette(stops))
+        master = self._track(field.convert('RGB'))
+        self._release(field)
+        del field
+
+        replay(_icon_layout_ops(r), core.canvas_draw(master, blend=False),
+               lambda color, op=None: core.flatten_color(resolve(color, op) if resolve else color))
+        self._master, self._master_size = master, r
+        return master
+
+    def render(self, size, output_path):
+        """Render one target and return its peak allocation in bytes."""
+        from PIL import Image
+        self.peak = sum(self.live.values())
+        r = self.render_size_for(size)
+        master = self.master(r)
+        if r != size:
+            self._transient(3 * size * r + 3 * size * size)
+            out = master.resize((size, size), Image.LANCZOS)
+        else:
+            out = master
+        save_png(out, output_path)
+        print(f"  ✓ {size}x{size} → {output_path}  (render {r}px, peak {self.peak / 2**20:.1f} MB)")
+        return self.peak
+
 def main():
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    
-    # Output directories
-    icon_dir = os.path.join(base_dir, 'assets', 'app_icon')
-    os.makedirs(icon_dir, exist_ok=True)
-    
-    # iOS asset catalog directory
-    ios_icon_dir = os.path.join(base_dir, 'ios', 'Runner', 'Assets.xcassets', 'AppIcon.appiconset')
-    os.makedirs(ios_icon_dir, exist_ok=True)
-    
-    # Android icon directories
-    android_dirs = {
-        'mipmap-mdpi': 48,
-        'mipmap-hdpi': 72,
-        'mipmap-xhdpi': 96,
-        'mipmap-xxhdpi': 144,
-        'mipmap-xxxhdpi': 192,
-    }
-    
     print("🎂 Generating Birthday Reminder App Icons\n")
-    
-    # 1. Master icon (1024x1024) for App Store
-    print("📱 App Store icon:")
-    master_path = os.path.join(icon_dir, 'app_icon_1024.png')
-    generate_icon(1024, master_path)
-    
-    # Also copy to iOS assets
-    ios_1024 = os.path.join(ios_icon_dir, 'Icon-App-1024x1024@1x.png')
-    generate_icon(1024, ios_1024)
-    
-    # 2. iOS icons
-    print("\n🍎 iOS icons:")
-    ios_sizes = {
-        'Icon-App-20x20@1x.png': 20,
-        'Icon-App-20x20@2x.png': 40,
-        'Icon-App-20x20@3x.png': 60,
-        'Icon-App-29x29@1x.png': 29,
-        'Icon-App-29x29@2x.png': 58,
-        'Icon-App-29x29@3x.png': 87,
-        'Icon-App-40x40@1x.png': 40,
-        'Icon-App-40x40@2x.png': 80,
-        'Icon-App-40x40@3x.png': 120,
-        'Icon-App-60x60@2x.png': 120,
-        'Icon-App-60x60@3x.png': 180,
-        'Icon-App-76x76@1x.png': 76,
-        'Icon-App-76x76@2x.png': 152,
-        'Icon-App-83.5x83.5@2x.png': 167,
-    }
-    
-    for filename, size in ios_sizes.items():
-        path = os.path.join(ios_icon_dir, filename)
-        generate_icon(size, path)
-    
-    # 3. Android icons
-    print("\n🤖 Android icons:")
-    for dir_name, size in android_dirs.items():
-        android_dir = os.path.join(base_dir, 'android', 'app', 'src', 'main', 'res', dir_name)
-        os.makedirs(android_dir, exist_ok=True)
-        path = os.path.join(android_dir, 'ic_launcher.png')
+
+    section = None
+    for title, _, rel_path, size in ICON_TARGETS:
+        if title != section:
+            if section is not None:
+                print()
+            print(f"{title}:")
+            section = title
+        path = os.path.join(BASE_DIR, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
         generate_icon(size, path)
-    
-    # 4. Web favicon
-    print("\n🌐 Web icons:")
-    web_dir = os.path.join(base_dir, 'web')
-    generate_icon(192, os.path.join(web_dir, 'icons', 'Icon-192.png'))
-    generate_icon(512, os.path.join(web_dir, 'icons', 'Icon-512.png'))
-    generate_icon(16, os.path.join(web_dir, 'favicon.png'))
-    
-    # 5. Google Play Store icon (512x512)
-    print("\n🏪 Store icons:")
-    generate_icon(512, os.path.join(icon_dir, 'play_store_512.png'))
-    
+
+    master_path = os.path.join(BASE_DIR, APP_ICON_DIR, 'app_icon_1024.png')
     print("\n✅ All icons generated successfully!")
     print(f"   Master icon: {master_path}")
-    print(f"   iOS icons: {ios_icon_dir}")
+    print(f"   iOS icons: {os.path.join(BASE_DIR, IOS_ICON_DIR)}")
     print(f"   Upload {master_path} to App Store Connect")
 
 if __name__ == '__main__':
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Bulk-render personalized birthday share cards ("Grattis på 60-årsdagen, Mamma!")
+from a CSV or JSONL file of contacts.
+
+Records are read lazily, shared layers (gradient background, confetti, age
+card, avatar sprites, fonts) are built once per worker and reused, and cards
+are rendered across all cores in bounded chunks so memory stays flat no matter
+how large the input is.
+
+Input columns / keys:
+  name      – required
+  birthday  – YYYY-MM-DD (or MM-DD when the year is unknown)
+  age       – optional, overrides the age computed from birthday
+
+Records that can't be read (unparseable JSONL line, missing name, bad
+birthday or age) are skipped and listed at the end; the rest of the batch
+still renders. File names keep letters in any script, without accents.
+
+Usage:
+  python scripts/generate_share_cards.py contacts.csv out/ [--size 1080x1350]
+      [--workers 8] [--chunk 512] [--format png|jpg|webp] [--date 2026-02-21]
+"""
+
+from PIL import Image, ImageDraw
+from functools import lru_cache
+from itertools import islice
+import argparse
+import datetime
+import multiprocessing
+import os
+import re
+import time
+import unicodedata
+
+from contacts import read_contacts, card_fields, avatar_color
+from render_core.palette import VIOLET, SKY, MINT, CORAL, PEACH, WHITE, DARK, lerp_color
+from render_core.gradient import draw_gradient_bg
+from render_core.shapes import draw_confetti
+from render_core.text import load_font, centered_text
+from render_core.cli import parse_size
+
+FORMATS = {'png': 'PNG', 'jpg': 'JPEG', 'webp': 'WEBP'}
+
+# ── Input ──────────────────────────────────────────────────
+
+def chunked(iterable, n):
+    """Yield lists of at most n items without materializing the iterable."""
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, n))
+        if not chunk:
+            return
+        yield chunk
+
+# ── Cached layers ──────────────────────────────────────────
+
+@lru_cache(maxsize=4)   # up to 48 MB per size; bounded for the render service
+def base_layer(w, h):
+    """Gradient background, confetti and the empty age card – shared by every card."""
+    img = Image.new('RGB', (w, h))
+    draw = ImageDraw.Draw(img, 'RGBA')
+    draw_gradient_bg(draw, w, h, VIOLET, SKY, MINT)
+    draw_confetti(draw, w, h, seed=26)
+    cm = int(w * 0.1); cw = w - cm * 2
+    card_y = int(h * 0.52); ch = int(h * 0.30)
+    for row in range(ch):
+        draw.rectangle([cm, card_y + row, cm + cw, card_y + row + 1],
+                       fill=lerp_color(CORAL, PEACH, row / ch))
+    return img
+
+@lru_cache(maxsize=64)
+def avatar_sprite(r, color):
+    """Anti-aliased avatar disc, rendered at 4x and reduced once per colour."""
+    big = Image.new('L', (r * 8, r * 8), 0)
+    ImageDraw.Draw(big).ellipse([0, 0, r * 8 - 1, r * 8 - 1], fill=255)
+    mask = big.resize((r * 2, r * 2), Image.LANCZOS)
+    disc = Image.new('RGB', mask.size, color)
+    return disc, mask
+
+# ── Rendering ──────────────────────────────────────────────
+
+def render_card(name, age, date_line, w, h):
+    """Render one share card and return it as an RGB image."""
+    img = base_layer(w, h).copy()
+    draw = ImageDraw.Draw(img, 'RGBA')
+    f_hero = load_font(int(h * 0.045))
+    f_name = load_font(int(h * 0.06))
+    f_huge = load_font(int(h * 0.16))
+    f_small = load_font(int(h * 0.026))
+
+    headline = f"Grattis på {age}-årsdagen," if age else "Grattis på födelsedagen,"
+    centered_text(draw, headline, int(h * 0.08), w, f_hero, WHITE)
+    centered_text(draw, f"{name}!", int(h * 0.14), w, f_name, WHITE)
+
+    r = int(w * 0.12)
+    color = avatar_color(name)
+    disc, mask = avatar_sprite(r, color)
+    av_cx = w // 2; av_cy = int(h * 0.36)
+    img.paste(disc, (av_cx - r, av_cy - r), mask)
+    initial = name[:1].upper()
+    ib = draw.textbbox((0, 0), initial, font=f_name)
+    draw.text((av_cx - (ib[0] + ib[2]) // 2, av_cy - (ib[1] + ib[3]) // 2), initial, fill=WHITE, font=f_name)
+
+    card_y = int(h * 0.52); ch = int(h * 0.30)
+    if age:
+        centered_text(draw, str(age), card_y + int(ch * 0.06), w, f_huge, WHITE)
+        centered_text(draw, "ÅR", card_y + int(ch * 0.66), w, f_small, (255, 255, 255, 210))
+        centered_text(draw, date_line, card_y + int(ch * 0.82), w, f_small, (255, 255, 255, 180))
+    else:
+        day, _, month = date_line.partition(' ')
+        centered_text(draw, day, card_y + int(ch * 0.06), w, f_huge, WHITE)
+        centered_text(draw, month.upper(), card_y + int(ch * 0.66), w, f_small, (255, 255, 255, 210))
+
+    centered_text(draw, "Födelsedagar", int(h * 0.9), w, f_small, (*DARK, 140))
+    return img
+
+def slugify(name):
+    """File-name slug; letters in any script are kept, accents are dropped."""
+    name = ''.join(c for c in unicodedata.normalize('NFKD', name) if not unicodedata.combining(c))
+    return re.sub(r'[\W_]+', '-', name.lower()).strip('-') or 'card'
+
+_job = {}
+
+def _init_worker(w, h, out_dir, fmt, today):
+    _job.update(w=w, h=h, out_dir=out_dir, fmt=fmt, today=today)
+    base_layer(w, h)  # warm the shared layer once per process
+
+def _render_task(item):
+    """Render one record; return (index, path, None) or (index, None, reason)."""
+    index, record = item
+    if isinstance(record, Exception):
+        return index, None, f"{type(record).__name__}: {record}"
+    try:
+        name, age, date_line = card_fields(record, _job['today'])
+    except (KeyError, ValueError, TypeError, AttributeError) as e:
+        return index, None, f"{type(e).__name__}: {e}"
+    img = render_card(name, age, date_line, _job['w'], _job['h'])
+    path = os.path.join(_job['out_dir'], f"{index:06d}_{slugify(name)}.{_job['fmt']}")
+    img.save(path, FORMATS[_job['fmt']])
+    return index, path, None
+
+def render_batch(records, out_dir, size=(1080, 1350), workers=None, chunk=512,
+                 fmt='png', today=None):
+    """Render every record to out_dir and return (count, seconds, skipped).
+
+    Only one chunk of records is held in memory at a time; each chunk is
+    spread across the worker pool and fully written before the next is read.
+    skipped lists (index, reason) for records that couldn't be rendered.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    today = today or datetime.date.today()
+    workers = workers or os.cpu_count() or 1
+    w, h = size
+    done = 0
+    skipped = []
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, _init_worker, (w, h, out_dir, fmt, today)) as pool:
+        for batch in chunked(enumerate(records), chunk):
+            per_task = max(1, len(batch) // (workers * 4))
+            for index, path, reason in pool.imap_unordered(_render_task, batch, chunksize=per_task):
+                if path is None:
+                    skipped.append((index, reason))
+                else:
+                    done += 1
+            elapsed = time.perf_counter() - start
+            print(f"  ✓ {done} cards · {done / elapsed:.1f} img/s")
+    return done, time.perf_counter() - start, sorted(skipped)
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-render birthday share cards.")
+    parser.add_argument('contacts', help="CSV or JSONL file with name, birthday[, age]")
+    parser.add_argument('out_dir')
+    parser.add_argument('--size', type=parse_size, default=(1080, 1350), help="WxH, default 1080x1350")
+    parser.add_argument('--workers', type=int, default=None, help="default: all cores")
+    parser.add_argument('--chunk', type=int, default=512, help="records held in memory at once")
+    parser.add_argument('--format', choices=sorted(FORMATS), default='png')
+    parser.add_argument('--date', type=datetime.date.fromisoformat, default=None,
+                        help="reference date for ages (default: today)")
+    args = parser.parse_args()
+
+    print(f"🎉 Rendering share cards {args.size[0]}×{args.size[1]} → {args.out_dir}\n")
+    count, secs, skipped = render_batch(read_contacts(args.contacts), args.out_dir, args.size,
+                               args.workers, args.chunk, args.format, args.date)
+    rate = count / secs if secs else 0.0
+    if skipped:
+        print(f"\n⚠️  Skipped {len(skipped)} malformed record(s):")
+        for index, reason in skipped[:20]:
+            print(f"  row {index}: {reason}")
+        if len(skipped) > 20:
+            print(f"  … and {len(skipped) - 20} more")
+    print(f"\n✅ Done! {count} cards in {secs:.1f}s ({rate:.1f} img/s)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Glyph atlas text drawing for high-volume renders.
+
+`draw.text` shapes and rasterizes the whole string through FreeType on every
+call. Here each (font, size, glyph) is rasterized once and kept as a coverage
+mask of the glyph's exact size. A string is then drawn by stamping its glyph
+masks with `draw.bitmap`, advancing by each glyph's advance width plus the
+font's kerning for the pair.
+
+Strings that need real shaping fall back to `draw.text`: right-to-left and
+Indic/South-East Asian scripts, combining marks, joiners, characters outside
+the BMP (emoji) and multi-line text. So do fonts that aren't FreeType fonts.
+Latin ligatures are not formed, matching Pillow's basic layout.
+
+Usage:
+  python scripts/glyph_atlas.py --benchmark [--strings 20000] [--px 36]
+"""
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+import argparse
+import random
+import time
+import unicodedata
+
+# Code point ranges that need shaping (RTL, Indic, SE Asian, Hangul jamo, Arabic forms)
+COMPLEX_RANGES = (
+    (0x0590, 0x08FF), (0x0900, 0x0DFF), (0x0E00, 0x0FFF), (0x1000, 0x109F),
+    (0x1100, 0x11FF), (0x1780, 0x18AF), (0x200C, 0x200F), (0x202A, 0x202E),
+    (0xA980, 0xABFF), (0xFB1D, 0xFDFF), (0xFE00, 0xFE0F), (0xFE70, 0xFEFF),
+)
+
+_simple = set()
+
+def needs_shaping(text):
+    """True if the text can't be drawn glyph by glyph."""
+    for ch in text:
+        if ch in _simple:
+            continue
+        cp = ord(ch)
+        if (ch == '\n' or cp > 0xFFFF or unicodedata.combining(ch)
+                or any(lo <= cp <= hi for lo, hi in COMPLEX_RANGES)):
+            return True
+        _simple.add(ch)
+    return False
+
+
+class GlyphAtlas:
+    """Coverage masks and metrics for one font at one size.
+
+    Glyphs are rasterized as they are first used, each into an 'L' mask of
+    its own bounding box – the size `draw.bitmap` stamps.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self.glyphs = {}      # char → (mask or None, (dx, dy), advance)
+        self.kerning = {}     # (left, right) → px
+
+    def glyph(self, ch):
+        g = self.glyphs.get(ch)
+        if g is None:
+            left, top, right, bottom = self.font.getbbox(ch)
+            w, h = max(right - left, 0), max(bottom - top, 0)
+            mask = None
+            if w and h:
+                mask = Image.new('L', (w, h), 0)
+                ImageDraw.Draw(mask).text((-left, -top), ch, fill=255, font=self.font)
+            g = self.glyphs[ch] = (mask, (left, top), self.font.getlength(ch))
+        return g
+
+    def kern(self, a, b):
+        k = self.kerning.get((a, b))
+        if k is None:
+            k = self.kerning[a, b] = (self.font.getlength(a + b)
+                                      - self.glyph(a)[2] - self.glyph(b)[2])
+        return k
+
+    def length(self, text):
+        pen, prev = 0.0, None
+        for ch in text:
+            if prev is not None:
+                pen += self.kern(prev, ch)
+            pen += self.glyph(ch)[2]
+            prev = ch
+        return pen
+
+    def draw(self, draw, xy, text, fill):
+        x, y = int(round(xy[0])), int(round(xy[1]))
+        pen, prev = 0.0, None
+        for ch in text:
+            mask, (dx, dy), advance = self.glyph(ch)
+            if prev is not None:
+                pen += self.kern(prev, ch)
+            if mask is not None:
+                draw.bitmap((x + int(round(pen)) + dx, y + dy), mask, fill=fill)
+            pen += advance
+            prev = ch
+
+
+_atlases = {}
+
+def atlas_for(font):
+    """The shared atlas of a FreeType font, or None if glyphs can't be cached."""
+    if not isinstance(font, ImageFont.FreeTypeFont):
+        return None
+    path = font.path if isinstance(font.path, str) else None
+    key = (path, font.getname(), font.size, font.index)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font)
+    return atlas
+
+def draw_text(draw, xy, text, fill=None, font=None):
+    """Drop-in for draw.text(xy, text, fill=fill, font=font) using the atlas."""
+    atlas = atlas_for(font)
+    if atlas is None or needs_shaping(text):
+        draw.text(xy, text, fill=fill, font=font)
+    else:
+        atlas.draw(draw, xy, text, fill)
+
+def text_length(text, font):
+    atlas = atlas_for(font)
+    if atlas is None or needs_shaping(text):
+        return font.getlength(text)
+    return atlas.length(text)
+
+# ── Benchmark ──────────────────────────────────────────────
+
+def benchmark(strings=20000, px=36):
+    """Time plain draw.text against the atlas on name and calendar-cell strings."""
+    from render_core.palette import DARK
+    from render_core.text import load_font
+    rng = random.Random(34)
+    first = ["Anna", "Björn", "Cecilia", "David", "Elsa", "Filip", "Greta", "Hugo", "Åsa", "Örjan"]
+    last = ["Svensson", "Karlsson", "Holm", "Lindberg", "Magnusson", "Johansson", "Ek"]
+    cases = {
+        'names': [f"{rng.choice(first)} {rng.choice(last)}" for _ in range(strings)],
+        'cells': [str(rng.randint(1, 31)) for _ in range(strings)],
+    }
+    font = load_font(px)
+    w, h = px * 20, px * 2
+    print(f"🔤 {strings} strings per case at {px}px\n")
+    print(f"  {'case':<8} {'draw.text':>12} {'atlas':>12} {'speedup':>8} {'max Δ':>8}")
+    for case, texts in cases.items():
+        results = []
+        for fn in (lambda d, t: d.text((4, 4), t, fill=DARK, font=font),
+                   lambda d, t: draw_text(d, (4, 4), t, fill=DARK, font=font)):
+            img = Image.new('RGB', (w, h), (255, 255, 255))
+            draw = ImageDraw.Draw(img, 'RGBA')
+            start = time.perf_counter()
+            for t in texts:
+                fn(draw, t)
+            results.append((time.perf_counter() - start) / len(texts) * 1e6)
+        plain, atlas = results
+        diffs = []
+        for t in texts[:50]:
+            a = Image.new('L', (w, h), 0); b = Image.new('L', (w, h), 0)
+            ImageDraw.Draw(a).text((4, 4), t, fill=255, font=font)
+            draw_text(ImageDraw.Draw(b), (4, 4), t, fill=255, font=font)
+            diffs.append(ImageChops.difference(a, b).getextrema()[1])
+        print(f"  {case:<8} {plain:9.1f} µs {atlas:9.1f} µs {plain / atlas:7.1f}× {max(diffs):8d}")
+    atlas = atlas_for(font)
+    mask_bytes = sum(g[0].width * g[0].height for g in atlas.glyphs.values() if g[0])
+    print(f"\n  atlas: {len(atlas.glyphs)} glyphs in {mask_bytes / 1024:.1f} KB of masks, "
+          f"{len(atlas.kerning)} kerning pairs")
+
+def main():
+    parser = argparse.ArgumentParser(description="Glyph atlas text drawing.")
+    parser.add_argument('--benchmark', action='store_true', help="compare against draw.text")
+    parser.add_argument('--strings', type=int, default=20000)
+    parser.add_argument('--px', type=int, default=36)
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark(args.strings, args.px)
+    else:
+        parser.print_help()
+
+if __name__ == '__main__':
+    main()
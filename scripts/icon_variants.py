@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Alternate app icon variants, each rendered for the full icon size matrix.
+
+A variant changes the aurora gradient stops and/or the cake's candles.
+Variants are spread across a process pool, one variant per task. Each
+variant renders a single master at the largest render size, and every
+target size is downscaled from it. Layers shared between variants are
+cached in each worker: the gradient progress field, warmed when the worker
+starts, and the cake layer per candle set, built the first time one of the
+worker's variants needs it. A background-only variant only pays for its
+palette.
+
+Outputs go to assets/icon_variants/<variant>/<same path as the regular icon>.
+
+Usage:
+  python scripts/icon_variants.py [--variant sunset ...] [--workers 4] [--list]
+"""
+
+from PIL import Image
+from collections import OrderedDict
+import argparse
+import multiprocessing
+import os
+import time
+
+from asset_targets import BASE_DIR, VARIANT_DIR, ICON_TARGETS, icon_render_size, variant_path
+from render_core.output import save_copies
+from generate_app_icon import (
+    AURORA, CANDLE_COLORS as CANDLES, cake_layer, icon_layout, variant_master,
+)
+
+# name → gradient stops, candle colours (cycled) and candle count
+VARIANTS = OrderedDict([
+    ('aurora',    dict(stops=AURORA, candle_colors=CANDLES, candles=3)),
+    ('sunset',    dict(stops=((255, 107, 138), (255, 176, 136), (251, 191, 36)),
+                       candle_colors=CANDLES, candles=3)),
+    ('ocean',     dict(stops=((52, 93, 200), (103, 195, 243), (110, 231, 183)),
+                       candle_colors=CANDLES, candles=3)),
+    ('midnight',  dict(stops=((26, 26, 46), (76, 56, 160), (124, 92, 252)),
+                       candle_colors=((251, 191, 36, 230), (255, 255, 255, 240)), candles=3)),
+    ('jul',       dict(stops=((180, 30, 50), (150, 20, 40), (30, 120, 80)),
+                       candle_colors=((255, 255, 255, 240), (210, 40, 60, 230)), candles=4)),
+    ('midsommar', dict(stops=((0, 106, 167), (120, 190, 235), (254, 220, 80)),
+                       candle_colors=((254, 204, 2, 230), (255, 255, 255, 240)), candles=3)),
+    ('party',     dict(stops=AURORA,
+                       candle_colors=((255, 107, 138, 230), (251, 191, 36, 230), (110, 231, 183, 230),
+                                      (103, 195, 243, 230), (167, 139, 250, 230)), candles=5)),
+])
+
+def size_matrix():
+    """{size: [relative paths]} for every icon target."""
+    sizes = {}
+    for _, _, rel_path, size in ICON_TARGETS:
+        sizes.setdefault(size, []).append(rel_path)
+    return sizes
+
+def _cake_key(spec):
+    return tuple(spec['candle_colors']), spec['candles']
+
+def _init_worker(render_size):
+    icon_layout(render_size)
+
+def _render_variant(item):
+    """Render one variant's master and all its sizes; return its timings."""
+    name, spec, render_size, sizes, out_root = item
+    start, cpu = time.perf_counter(), time.process_time()
+    master = variant_master(render_size, tuple(spec['stops']), *_cake_key(spec))
+    t_master = time.perf_counter() - start
+    files = 0
+    for size, rel_paths in sizes.items():
+        img = master if size == render_size else master.resize((size, size), Image.LANCZOS,
+                                                                reducing_gap=3.0)
+        files += len(save_copies(img, [os.path.join(out_root, variant_path(name, p)) for p in rel_paths]))
+    total = time.perf_counter() - start
+    return name, os.getpid(), t_master, total - t_master, total, files, time.process_time() - cpu
+
+def render_variants(names, workers=None, out_root=BASE_DIR):
+    """Render the selected variants across a pool; return their timing rows."""
+    sizes = size_matrix()
+    render_size = icon_render_size(max(sizes))
+    cakes = sorted({_cake_key(VARIANTS[n]) for n in names})
+    workers = min(workers or os.cpu_count() or 1, len(names))
+    items = [(n, VARIANTS[n], render_size, sizes, out_root) for n in names]
+    rows = {}
+    with multiprocessing.Pool(workers, _init_worker, (render_size,)) as pool:
+        for row in pool.imap_unordered(_render_variant, items):
+            rows[row[0]] = row
+            print(f"  ✓ {row[0]}  ({row[5]} files)")
+    return [rows[n] for n in names], render_size, len(cakes), workers
+
+def print_report(rows, wall):
+    print(f"\n  {'variant':<11} {'worker':>7} {'master':>8} {'sizes':>8} {'total':>8} {'files':>6}")
+    for name, pid, t_master, t_sizes, total, files, _ in rows:
+        print(f"  {name:<11} {pid:>7} {t_master:7.2f}s {t_sizes:7.2f}s {total:7.2f}s {files:>6}")
+    cpu = sum(r[6] for r in rows)
+    print(f"\n  {cpu:.1f}s of CPU in {wall:.1f}s wall ({cpu / wall:.1f}× parallel)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Render alternate app icon variants.")
+    parser.add_argument('--variant', action='append', choices=list(VARIANTS),
+                        help="repeatable; default: every variant")
+    parser.add_argument('--workers', type=int, default=None, help="default: all cores")
+    parser.add_argument('--list', action='store_true', help="list the variants and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, spec in VARIANTS.items():
+            print(f"  {name:<11} stops {spec['stops']}  {spec['candles']} candles")
+        return
+
+    names = args.variant or list(VARIANTS)
+    print(f"🎨 Rendering {len(names)} icon variant(s) × {len(ICON_TARGETS)} targets\n")
+    start = time.perf_counter()
+    rows, render_size, cakes, workers = render_variants(names, args.workers)
+    print(f"\n  master {render_size}px · {cakes} cake layer(s) · {workers} worker(s)")
+    print_report(rows, time.perf_counter() - start)
+    print(f"\n✅ Done! Variants in: {os.path.join(BASE_DIR, VARIANT_DIR)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Scroll-capture renders of the home and import lists for any number of contacts.
+
+The lists look like `screen_home` / `screen_import`, but rows come from real
+data and the list scrolls instead of stopping at the bottom of the screen.
+Rows have a fixed pitch, so the rows visible at any scroll offset are known
+arithmetically. Contacts are pulled from the input only as pages reach
+them, and rows that have scrolled past are dropped. Each page draws only
+its visible rows. A row is a cached sprite per style (card, avatar disc,
+badge or checkbox) plus its own text, drawn from the glyph atlas.
+
+Memory and time per page depend on the screen size only, never on the
+length of the list. A tall image holds the whole list by definition.
+
+Contacts that can't be read (unparseable JSONL line, missing name, bad
+birthday or age) are skipped and listed at the end, as for share cards.
+
+Usage:
+  python scripts/list_pages.py contacts.csv out/ [--screen home|import]
+      [--size 1170x2532] [--tall] [--sort] [--date 2026-02-21]
+"""
+
+from PIL import Image, ImageDraw
+from collections import namedtuple
+from functools import lru_cache
+import argparse
+import datetime
+import os
+import time
+
+from render_core.palette import VIOLET, WHITE, DARK, GREY, LIGHT_BG
+from render_core.text import get_fonts, centered_text
+from render_core.cli import parse_size
+from glyph_atlas import draw_text, text_length
+from contacts import (
+    MONTHS, read_contacts, parse_birthday, next_birthday, card_fields, avatar_color,
+)
+
+# Vertical metrics as fractions of the screen height, taken from the screens:
+# (list top, row height, row gap, space reserved below the list)
+LIST_METRICS = {
+    'home':   (0.15, 0.10, 0.015, 0.10),
+    'import': (0.19, 0.085, 0.01, 0.18),
+}
+TITLES = {
+    'home': ("Fodelsedagar", None),
+    'import': ("Importera kontakter", "Lagg till fran din telefonbok"),
+}
+
+Layout = namedtuple('Layout', 'sw sh top bottom cm cw ch pitch cr')
+
+MALFORMED = (KeyError, ValueError, TypeError, AttributeError)
+
+# ── Rows (lazy) ────────────────────────────────────────────
+
+def days_until(record, today):
+    _, month, day = parse_birthday(record['birthday'])
+    return (next_birthday(month, day, today) - today).days
+
+def _skip(skipped, index, error):
+    skipped.append((index, f"{type(error).__name__}: {error}"))
+
+def home_rows(records, today, skipped, soonest_first=False):
+    """Yield home rows (name, days, age line, colour, highlight) per contact.
+
+    Unreadable records are appended to skipped as (index, reason).
+    soonest_first sorts by days left, which holds every row in memory.
+    """
+    def dated():
+        for index, record in enumerate(records):
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                name, age, _ = card_fields(record, today)
+                days = days_until(record, today)
+            except MALFORMED as e:
+                _skip(skipped, index, e)
+                continue
+            yield days, (name, "Idag!" if days == 0 else f"{days} dagar",
+                         f"Fyller {age} ar" if age else "", avatar_color(name), days == 0)
+
+    rows = dated()
+    if soonest_first:
+        rows = sorted(rows, key=lambda r: r[0])
+    for _, row in rows:
+        yield row
+
+def import_rows(records, skipped):
+    """Yield import rows (name, birthday line, colour, selected) per contact.
+
+    Unreadable records are appended to skipped as (index, reason).
+    """
+    for index, record in enumerate(records):
+        try:
+            if isinstance(record, Exception):
+                raise record
+            name = record['name'].strip()
+            year, month, day = parse_birthday(record['birthday'])
+            datetime.date(year or 2000, month, day)   # rejects month 13, 31 April, …
+            bday = f"{day} {MONTHS[month - 1][:3]}" + (f" {year}" if year else "")
+        except MALFORMED as e:
+            _skip(skipped, index, e)
+            continue
+        selected = str(record.get('selected', '1')).strip().lower() not in ('0', 'false', 'no', '')
+        yield name, bday, avatar_color(name), selected
+
+# ── Layout ─────────────────────────────────────────────────
+
+@lru_cache(maxsize=None)
+def list_layout(kind, sw, sh):
+    top, ch, gap, reserved = LIST_METRICS[kind]
+    ch = int(sh * ch)
+    return Layout(sw, sh, int(sh * top), sh - int(sh * reserved), int(sw * 0.05),
+                  sw - int(sw * 0.05) * 2, ch, ch + int(sh * gap),
+                  int(sw * (0.05 if kind == 'home' else 0.04)))
+
+def visible_range(offset, view_h, pitch, count=None):
+    """Indices [first, last) of rows that intersect a viewport at offset."""
+    first = max(0, offset // pitch)
+    last = -(-(offset + view_h) // pitch)
+    return first, last if count is None else min(last, count)
+
+# ── Row sprites ────────────────────────────────────────────
+
+@lru_cache(maxsize=64)
+def row_sprite(kind, sw, sh, color, flag):
+    """Everything in a row except its text, over the list background.
+
+    flag is the highlight (home) or selected (import) state, so a list of
+    any length needs at most two sprites per avatar colour.
+    """
+    lay = list_layout(kind, sw, sh)
+    cm, cw, ch, cr = lay.cm, lay.cw, lay.ch, lay.cr
+    img = Image.new('RGB', (sw, ch + 1), LIGHT_BG)
+    draw = ImageDraw.Draw(img, 'RGBA')
+    if kind == 'home':
+        bg = (*color, 22) if flag else (255, 255, 255, 220)
+        draw.rounded_rectangle([cm, 0, cm + cw, ch], radius=cr, fill=bg)
+        if flag:
+            draw.rounded_rectangle([cm, 0, cm + cw, ch], radius=cr, outline=(*color, 180), width=3)
+        av_r = int(ch * 0.33)
+        bw = int(cw * 0.22); bh = int(ch * 0.42)
+        bx = cm + cw - bw - int(cw * 0.04); by_ = (ch - bh) // 2
+        draw.rounded_rectangle([bx, by_, bx + bw, by_ + bh], radius=bh // 2, fill=color)
+    else:
+        draw.rounded_rectangle([cm, 0, cm + cw, ch], radius=cr, fill=(255, 255, 255, 230))
+        if flag:
+            draw.rounded_rectangle([cm, 0, cm + cw, ch], radius=cr, outline=(*color, 120), width=2)
+        av_r = int(ch * 0.32)
+        cb_r = int(ch * 0.22); cb_cx = cm + cw - int(cw * 0.08); cb_cy = ch // 2
+        if flag:
+            draw.ellipse([cb_cx - cb_r, cb_cy - cb_r, cb_cx + cb_r, cb_cy + cb_r], fill=color)
+            draw.text((cb_cx - int(cb_r * 0.5), cb_cy - int(cb_r * 0.6)), "✓", fill=WHITE,
+                      font=get_fonts(sh)[4])
+        else:
+            draw.ellipse([cb_cx - cb_r, cb_cy - cb_r, cb_cx + cb_r, cb_cy + cb_r],
+                         outline=(200, 200, 210), width=2)
+    av_cx = cm + int(cw * 0.09); av_cy = ch // 2
+    draw.ellipse([av_cx - av_r, av_cy - av_r, av_cx + av_r, av_cy + av_r], fill=color)
+    return img
+
+def draw_row(img, draw, kind, lay, row, y):
+    """Paste the row's sprite at y and draw its text."""
+    _, _, f_body, f_small, f_tiny = get_fonts(lay.sh)
+    cm, cw, ch = lay.cm, lay.cw, lay.ch
+    name, detail, color, flag = (row[0], row[2], row[3], row[4]) if kind == 'home' else row
+    img.paste(row_sprite(kind, lay.sw, lay.sh, color, flag), (0, y))
+    av_r = int(ch * (0.33 if kind == 'home' else 0.32))
+    av_cx = cm + int(cw * 0.09); av_cy = y + ch // 2
+    nudge = 0.45 if kind == 'home' else 0.4
+    draw_text(draw, (av_cx - int(av_r * nudge), av_cy - int(av_r * 0.55)), name[:1], fill=WHITE, font=f_small)
+    tx = av_cx + av_r + int(cw * 0.04)
+    draw_text(draw, (tx, y + int(ch * 0.15)), name, fill=DARK, font=f_body)
+    draw_text(draw, (tx, y + int(ch * 0.55)), detail, fill=GREY, font=f_tiny)
+    if kind == 'home':
+        days = row[1]
+        bw = int(cw * 0.22); bh = int(ch * 0.42)
+        bx = cm + cw - bw - int(cw * 0.04); by_ = y + (ch - bh) // 2
+        tw = int(text_length(days, f_tiny))
+        draw_text(draw, (bx + (bw - tw) // 2, by_ + int(bh * 0.2)), days, fill=WHITE, font=f_tiny)
+
+# ── Chrome ─────────────────────────────────────────────────
+
+def draw_header(draw, kind, lay):
+    _, f_title, _, _, f_tiny = get_fonts(lay.sh)
+    title, sub = TITLES[kind]
+    bar_h = int(lay.sh * 0.07)
+    draw.text((int(lay.sw * 0.06), bar_h), title, fill=DARK, font=f_title)
+    if sub:
+        draw.text((int(lay.sw * 0.06), bar_h + int(lay.sh * 0.055)), sub, fill=GREY, font=f_tiny)
+
+def draw_footer(draw, kind, lay, label=None):
+    sw, sh = lay.sw, lay.sh
+    if kind == 'home':
+        nav_y = sh - int(sh * 0.07)
+        draw.rectangle([0, nav_y, sw, sh], fill=(255, 255, 255, 240))
+        for i, ic in enumerate([VIOLET, (190, 190, 200), (190, 190, 200), (190, 190, 200)]):
+            nx = sw // 8 + i * (sw // 4); ny = nav_y + int(sh * 0.025); nr = int(sw * 0.025)
+            draw.ellipse([nx - nr, ny - nr, nx + nr, ny + nr], fill=ic)
+    else:
+        btn_y = sh - int(sh * 0.14); bh = int(sh * 0.065); bm = int(sw * 0.06)
+        draw.rounded_rectangle([bm, btn_y, sw - bm, btn_y + bh], radius=bh // 2, fill=VIOLET)
+        centered_text(draw, label or "Importera kontakter", btn_y + int(bh * 0.25), sw,
+                      get_fonts(sh)[3], WHITE)
+
+# ── Rendering ──────────────────────────────────────────────
+
+def render_pages(rows, kind, size=(1170, 2532), step=None):
+    """Yield (page number, image) for a lazily consumed row iterable.
+
+    Each page scrolls the list by step pixels (default: the list viewport
+    height, so rows cut at a page edge continue on the next page). Only the
+    rows intersecting the viewport are held. The page and viewport canvases
+    are reused, so save or copy each page before advancing.
+    """
+    sw, sh = size
+    lay = list_layout(kind, sw, sh)
+    view_h = lay.bottom - lay.top
+    step = step or view_h
+    page = Image.new('RGB', size, LIGHT_BG)
+    view = Image.new('RGB', (sw, view_h), LIGHT_BG)
+    page_draw = ImageDraw.Draw(page, 'RGBA')
+    view_draw = ImageDraw.Draw(view, 'RGBA')
+    it = enumerate(rows)
+    window = []          # (index, row) for rows not yet scrolled past
+    exhausted = False
+    offset = 0
+    number = 1
+    while True:
+        first, last = visible_range(offset, view_h, lay.pitch)
+        window = [(i, row) for i, row in window if i >= first]
+        while not exhausted and (not window or window[-1][0] < last - 1):
+            try:
+                window.append(next(it))
+            except StopIteration:
+                exhausted = True
+        visible = [(i, row) for i, row in window if i < last]
+        if not visible and number > 1:
+            return
+        view.paste(LIGHT_BG, (0, 0, sw, view_h))
+        for i, row in visible:
+            draw_row(view, view_draw, kind, lay, row, i * lay.pitch - offset)
+        page.paste(LIGHT_BG, (0, 0, sw, sh))
+        draw_header(page_draw, kind, lay)
+        page.paste(view, (0, lay.top))
+        draw_footer(page_draw, kind, lay)
+        yield number, page
+        if exhausted and (not window or window[-1][0] * lay.pitch + lay.ch <= offset + view_h):
+            return
+        offset += step
+        number += 1
+
+def render_tall(rows, kind, size=(1170, 2532), label=None):
+    """The whole list as one image: header, every row, then the footer."""
+    rows = list(rows)
+    sw, sh = size
+    lay = list_layout(kind, sw, sh)
+    list_h = max(len(rows) * lay.pitch, lay.bottom - lay.top)
+    img = Image.new('RGB', (sw, lay.top + list_h + sh - lay.bottom), LIGHT_BG)
+    draw = ImageDraw.Draw(img, 'RGBA')
+    draw_header(draw, kind, lay)
+    for i, row in enumerate(rows):
+        draw_row(img, draw, kind, lay, row, lay.top + i * lay.pitch)
+    footer = Image.new('RGB', (sw, sh), LIGHT_BG)
+    fdraw = ImageDraw.Draw(footer, 'RGBA')
+    draw_footer(fdraw, kind, lay, label)
+    img.paste(footer.crop((0, lay.bottom, sw, sh)), (0, lay.top + list_h))
+    return img
+
+def main():
+    parser = argparse.ArgumentParser(description="Render long contact lists as pages or one tall image.")
+    parser.add_argument('contacts', help="CSV or JSONL file with name, birthday[, age, selected]")
+    parser.add_argument('out_dir')
+    parser.add_argument('--screen', choices=sorted(LIST_METRICS), default='home')
+    parser.add_argument('--size', type=parse_size, default=(1170, 2532), help="WxH of one screen")
+    parser.add_argument('--tall', action='store_true', help="one tall image instead of pages")
+    parser.add_argument('--sort', action='store_true',
+                        help="home: soonest birthday first (holds every record in memory)")
+    parser.add_argument('--date', type=datetime.date.fromisoformat, default=None,
+                        help="reference date for countdowns (default: today)")
+    args = parser.parse_args()
+
+    today = args.date or datetime.date.today()
+    records = read_contacts(args.contacts)
+    skipped = []
+    if args.screen == 'home':
+        rows = home_rows(records, today, skipped, args.sort)
+    else:
+        rows = import_rows(records, skipped)
+    os.makedirs(args.out_dir, exist_ok=True)
+    w, h = args.size
+    start = time.perf_counter()
+
+    if args.tall:
+        rows = list(rows)
+        label = None
+        if args.screen == 'import':
+            label = f"Importera {sum(1 for r in rows if r[3])} kontakter"
+        img = render_tall(rows, args.screen, args.size, label)
+        out = os.path.join(args.out_dir, f"{args.screen}_list.png")
+        img.save(out, 'PNG')
+        print(f"  ✓ {img.width}×{img.height}  {os.path.basename(out)}  ({len(rows)} rows)")
+    else:
+        print(f"📜 {args.screen} list {w}×{h} → {args.out_dir}\n")
+        for number, page in render_pages(rows, args.screen, args.size):
+            out = os.path.join(args.out_dir, f"{args.screen}_page_{number:04d}.png")
+            page.save(out, 'PNG')
+            print(f"  ✓ page {number}  {os.path.basename(out)}")
+
+    if skipped:
+        print(f"\n⚠️  Skipped {len(skipped)} malformed record(s):")
+        for index, reason in skipped[:20]:
+            print(f"  row {index}: {reason}")
+        if len(skipped) > 20:
+            print(f"  … and {len(skipped) - 20} more")
+    print(f"\n✅ Done in {time.perf_counter() - start:.1f}s")
+
+if __name__ == '__main__':
+    main()
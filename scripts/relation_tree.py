@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Tidy layout and rendering for relation trees of any size.
+
+The layout is Buchheim–Walker's linear-time variant of the Reingold–Tilford
+tidy tree, with each node's width taken from its label pill so neighbouring
+labels never collide. Edges are rasterized into one colour layer and coverage
+mask and composited in a single paste, and trees larger than one canvas are
+split into tiles so memory stays bounded.
+
+Input JSON (for the command line):
+  {"people": [{"id": "a", "name": "Anna", "label": "JAG", "parent": null}, ...],
+   "links":  [["k", "d"], ...]}            # optional non-tree edges (partners)
+
+Usage:
+  python scripts/relation_tree.py people.json out_dir [--tile 4096] [--radius 48]
+  python scripts/relation_tree.py --benchmark
+"""
+
+from PIL import Image, ImageDraw
+import argparse
+import json
+import os
+import random
+import time
+
+from render_core.palette import VIOLET, SKY, MINT2, CORAL, PEACH, GOLD, WHITE
+from render_core.text import load_font
+
+NODE_COLORS = [CORAL, SKY, MINT2, PEACH, GOLD, VIOLET]
+
+
+class TreeNode:
+    __slots__ = ('id', 'initial', 'label', 'color', 'is_owner', 'parent', 'children',
+                 'width', 'number', 'prelim', 'mod', 'thread', 'ancestor', 'change',
+                 'shift', 'x', 'y')
+
+    def __init__(self, id, name, label='', color=VIOLET, is_owner=False):
+        self.id = id
+        self.initial = name[:1].upper()
+        self.label = label
+        self.color = color
+        self.is_owner = is_owner
+        self.parent = None
+        self.children = []
+        self.width = 0
+        self.x = self.y = 0
+
+    def add(self, child):
+        child.parent = self
+        self.children.append(child)
+        return child
+
+
+def iter_preorder(root):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children))
+
+def iter_postorder(root):
+    out = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        out.append(node)
+        stack.extend(node.children)
+    return reversed(out)
+
+def build_tree(people):
+    """Build a TreeNode tree from dicts with id/name/label/parent[/color]; returns the root.
+
+    Raises ValueError for input that doesn't form one tree: a missing or
+    duplicate id, an unknown parent, or people caught in a parent cycle.
+    """
+    nodes = {}
+    parents = {}
+    for i, p in enumerate(people):
+        if 'id' not in p:
+            raise ValueError(f"person {i} has no id")
+        if p['id'] in nodes:
+            raise ValueError(f"duplicate id {p['id']!r}")
+        color = tuple(p['color']) if p.get('color') else NODE_COLORS[i % len(NODE_COLORS)]
+        nodes[p['id']] = TreeNode(p['id'], p.get('name', '?'), p.get('label', ''), color)
+        parents[p['id']] = p.get('parent')
+    roots = [nodes[i] for i, par in parents.items() if par is None]
+    if len(roots) != 1:
+        raise ValueError(f"expected exactly one root, found {len(roots)}")
+    for i, par in parents.items():
+        if par is None:
+            continue
+        if par not in nodes:
+            raise ValueError(f"{i!r} has unknown parent {par!r}")
+        nodes[par].add(nodes[i])
+    reached = {n.id for n in iter_preorder(roots[0])}
+    if len(reached) != len(nodes):
+        cut = [i for i in nodes if i not in reached]
+        raise ValueError(f"{len(cut)} people not connected to the root (parent cycle): "
+                         f"{', '.join(map(repr, cut[:10]))}{' …' if len(cut) > 10 else ''}")
+    roots[0].is_owner = True
+    roots[0].color = VIOLET
+    return roots[0]
+
+# ── Layout ─────────────────────────────────────────────────
+
+def _next_left(v):
+    return v.children[0] if v.children else v.thread
+
+def _next_right(v):
+    return v.children[-1] if v.children else v.thread
+
+def _move_subtree(wl, wr, shift):
+    subtrees = wr.number - wl.number
+    wr.change -= shift / subtrees
+    wr.shift += shift
+    wl.change += shift / subtrees
+    wr.prelim += shift
+    wr.mod += shift
+
+def _execute_shifts(v):
+    shift = change = 0.0
+    for w in reversed(v.children):
+        w.prelim += shift
+        w.mod += shift
+        change += w.change
+        shift += w.shift + change
+
+def _apportion(v, left, default_ancestor, gap):
+    vip = vop = v
+    vim = left
+    vom = v.parent.children[0]
+    sip = sop = v.mod
+    sim = vim.mod
+    som = vom.mod
+    while _next_right(vim) and _next_left(vip):
+        vim = _next_right(vim)
+        vip = _next_left(vip)
+        vom = _next_left(vom)
+        vop = _next_right(vop)
+        vop.ancestor = v
+        shift = (vim.prelim + sim) - (vip.prelim + sip) + (vim.width + vip.width) / 2 + gap
+        if shift > 0:
+            a = vim.ancestor if vim.ancestor.parent is v.parent else default_ancestor
+            _move_subtree(a, v, shift)
+            sip += shift
+            sop += shift
+        sim += vim.mod
+        sip += vip.mod
+        som += vom.mod
+        sop += vop.mod
+    if _next_right(vim) and not _next_right(vop):
+        vop.thread = _next_right(vim)
+        vop.mod += sim - sop
+    if _next_left(vip) and not _next_left(vom):
+        vom.thread = _next_left(vip)
+        vom.mod += sip - som
+        default_ancestor = v
+    return default_ancestor
+
+def node_radius(node, r):
+    return int(r * 1.2) if node.is_owner else r
+
+def label_height(f_label):
+    return getattr(f_label, 'size', 10) + 8
+
+def layout_tree(root, r, label_font, sibling_gap=None, subtree_gap=None, level_gap=None, margin=None):
+    """Assign pixel x/y to every node and return the (width, height) of the drawing.
+
+    Runs in O(n) without recursion, so arbitrarily deep trees are fine.
+    """
+    sibling_gap = r // 3 if sibling_gap is None else sibling_gap
+    subtree_gap = r if subtree_gap is None else subtree_gap
+    label_h = label_height(label_font)
+    level_h = int(r * 2.4) + label_h + (r if level_gap is None else level_gap)
+    margin = r if margin is None else margin
+
+    for node in iter_preorder(root):
+        pill = int(label_font.getlength(node.label)) + 16 if node.label else 0
+        node.width = max(node_radius(node, r) * 2, pill)
+        node.prelim = node.mod = node.change = node.shift = 0.0
+        node.thread = None
+        node.ancestor = node
+        for i, c in enumerate(node.children, 1):
+            c.number = i
+
+    # First walk: post-order, placing each child next to its left sibling
+    # before apportioning it, exactly as in the recursive formulation.
+    for v in iter_postorder(root):
+        if not v.children:
+            continue
+        default_ancestor = v.children[0]
+        prev = None
+        for w in v.children:
+            if prev is not None:
+                base = w.prelim
+                w.prelim = prev.prelim + (prev.width + w.width) / 2 + sibling_gap
+                if w.children:
+                    w.mod = w.prelim - base
+                default_ancestor = _apportion(w, prev, default_ancestor, subtree_gap)
+            prev = w
+        _execute_shifts(v)
+        v.prelim = (v.children[0].prelim + v.children[-1].prelim) / 2
+
+    # Second walk: absolute positions from accumulated modifiers.
+    stack = [(root, 0.0, 0)]
+    min_x, max_x = float('inf'), float('-inf')
+    max_depth = 0
+    while stack:
+        node, m, depth = stack.pop()
+        node.x = node.prelim + m
+        node.y = depth
+        min_x = min(min_x, node.x - node.width / 2)
+        max_x = max(max_x, node.x + node.width / 2)
+        max_depth = max(max_depth, depth)
+        for c in node.children:
+            stack.append((c, m + node.mod, depth + 1))
+
+    top = margin + int(r * 1.2)
+    for node in iter_preorder(root):
+        node.x = int(node.x - min_x) + margin
+        node.y = top + node.y * level_h
+    return int(max_x - min_x) + margin * 2, top + max_depth * level_h + r + label_h + margin
+
+# ── Drawing ────────────────────────────────────────────────
+
+def draw_node(draw, x, y, r, initial, color, label, f_initial, f_label, label_h, is_owner=False):
+    draw.ellipse([x-r, y-r, x+r, y+r], fill=color)
+    if is_owner:
+        draw.ellipse([x-r, y-r, x+r, y+r], outline=GOLD, width=3)
+    draw.text((x-int(r*0.4), y-int(r*0.55)), initial, fill=WHITE, font=f_initial)
+    if label:
+        lw = int(f_label.getlength(label)) + 16
+        lx = x-lw//2; ly = y+r+4
+        draw.rounded_rectangle([lx, ly, lx+lw, ly+label_h], radius=label_h//2, fill=color)
+        draw.text((lx+8, ly+2), label, fill=WHITE, font=f_label)
+
+def tree_edges(root, r):
+    """(x1, y1, x2, y2, colour) for every parent → child edge."""
+    edges = []
+    for node in iter_preorder(root):
+        pr = node_radius(node, r)
+        for c in node.children:
+            edges.append((node.x, node.y + pr, c.x, c.y - node_radius(c, r), c.color))
+    return edges
+
+def draw_edges(img, edges, origin=(0, 0), alpha=110, width=3):
+    """Rasterize all edges into one colour layer and one coverage mask, then
+    composite them with a single paste over the edges' bounding box."""
+    if not edges:
+        return
+    ox, oy = origin
+    x0 = max(0, min(min(e[0], e[2]) for e in edges) - ox - width)
+    y0 = max(0, min(min(e[1], e[3]) for e in edges) - oy - width)
+    x1 = min(img.width, max(max(e[0], e[2]) for e in edges) - ox + width + 1)
+    y1 = min(img.height, max(max(e[1], e[3]) for e in edges) - oy + width + 1)
+    if x0 >= x1 or y0 >= y1:
+        return
+    layer = Image.new('RGB', (x1 - x0, y1 - y0))
+    mask = Image.new('L', layer.size, 0)
+    draw_layer = ImageDraw.Draw(layer)
+    draw_mask = ImageDraw.Draw(mask)
+    dx, dy = ox + x0, oy + y0
+    for ex1, ey1, ex2, ey2, color in edges:
+        xy = [(ex1 - dx, ey1 - dy), (ex2 - dx, ey2 - dy)]
+        draw_layer.line(xy, fill=color, width=width)
+        draw_mask.line(xy, fill=alpha, width=width)
+    img.paste(layer, (x0, y0), mask)
+
+def _bucket(items, bbox, tile, cols, rows):
+    buckets = {}
+    for item in items:
+        x1, y1, x2, y2 = bbox(item)
+        for row in range(max(0, y1 // tile), min(rows - 1, y2 // tile) + 1):
+            for col in range(max(0, x1 // tile), min(cols - 1, x2 // tile) + 1):
+                buckets.setdefault((row, col), []).append(item)
+    return buckets
+
+def render_tiles(root, r, size, tile=4096, links=(), bg=(248, 247, 252)):
+    """Yield (row, col, image) tiles covering the laid-out tree.
+
+    Nodes and edges are bucketed per tile up front so each tile only draws
+    what it overlaps.
+    """
+    w, h = size
+    f_initial = load_font(r)
+    f_label = load_font(max(10, int(r * 0.45)))
+    label_h = label_height(f_label)
+    cols = (w + tile - 1) // tile
+    rows = (h + tile - 1) // tile
+
+    nodes = list(iter_preorder(root))
+    node_bbox = lambda n: (n.x - n.width // 2, n.y - node_radius(n, r),
+                           n.x + n.width // 2, n.y + node_radius(n, r) + label_h + 4)
+    edges = tree_edges(root, r) + [(a.x + node_radius(a, r), a.y, b.x - node_radius(b, r), b.y, a.color)
+                                   for a, b in links]
+    edge_bbox = lambda e: (min(e[0], e[2]), min(e[1], e[3]), max(e[0], e[2]), max(e[1], e[3]))
+    node_tiles = _bucket(nodes, node_bbox, tile, cols, rows)
+    edge_tiles = _bucket(edges, edge_bbox, tile, cols, rows)
+
+    for row in range(rows):
+        for col in range(cols):
+            ox, oy = col * tile, row * tile
+            img = Image.new('RGB', (min(tile, w - ox), min(tile, h - oy)), bg)
+            draw_edges(img, edge_tiles.get((row, col), ()), origin=(ox, oy))
+            draw = ImageDraw.Draw(img, 'RGBA')
+            for n in node_tiles.get((row, col), ()):
+                draw_node(draw, n.x - ox, n.y - oy, node_radius(n, r), n.initial, n.color,
+                          n.label, f_initial, f_label, label_h, n.is_owner)
+            yield row, col, img
+
+# ── Benchmark & CLI ────────────────────────────────────────
+
+def random_tree(n, seed=28):
+    rng = random.Random(seed)
+    labels = ["Mamma", "Pappa", "Syster", "Bror", "Vän", "Kusin", "Moster", "Farbror"]
+    people = [{'id': 0, 'name': 'A', 'label': 'JAG', 'parent': None}]
+    for i in range(1, n):
+        people.append({'id': i, 'name': chr(65 + i % 26), 'label': rng.choice(labels),
+                       'parent': rng.randrange(i)})
+    return build_tree(people)
+
+def benchmark(sizes=(10, 100, 1000, 10000), r=24, tile=4096):
+    print("🌳 Relation tree layout / render benchmark\n")
+    print(f"  {'nodes':>6}  {'canvas':>15}  {'tiles':>5}  {'layout':>9}  {'render':>9}")
+    f_label = load_font(max(10, int(r * 0.45)))
+    for n in sizes:
+        root = random_tree(n)
+        t0 = time.perf_counter()
+        size = layout_tree(root, r, f_label)
+        t1 = time.perf_counter()
+        tiles = sum(1 for _ in render_tiles(root, r, size, tile))
+        t2 = time.perf_counter()
+        print(f"  {n:>6}  {size[0]:>7}×{size[1]:<7}  {tiles:>5}  "
+              f"{(t1 - t0) * 1000:>7.1f}ms  {(t2 - t1) * 1000:>7.1f}ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Lay out and render a relation tree.")
+    parser.add_argument('people', nargs='?', help="JSON file with people (and optional links)")
+    parser.add_argument('out_dir', nargs='?')
+    parser.add_argument('--radius', type=int, default=48)
+    parser.add_argument('--tile', type=int, default=4096)
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+    if not (args.people and args.out_dir):
+        parser.error("people and out_dir are required unless --benchmark is given")
+
+    with open(args.people, encoding='utf-8') as f:
+        data = json.load(f)
+    try:
+        root = build_tree(data['people'])
+        by_id = {n.id: n for n in iter_preorder(root)}
+        unknown = [i for link in data.get('links', []) for i in link if i not in by_id]
+        if unknown:
+            raise ValueError(f"links name unknown ids: {', '.join(map(repr, unknown))}")
+    except ValueError as e:
+        parser.error(f"{args.people}: {e}")
+    links = [(by_id[a], by_id[b]) for a, b in data.get('links', [])]
+    size = layout_tree(root, args.radius, load_font(max(10, int(args.radius * 0.45))))
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    print(f"🌳 {len(by_id)} people → {size[0]}×{size[1]}\n")
+    for row, col, img in render_tiles(root, args.radius, size, args.tile, links):
+        path = os.path.join(args.out_dir, f"tree_r{row:02d}_c{col:02d}.png")
+        img.save(path, 'PNG')
+        print(f"  ✓ {img.width}×{img.height}  {os.path.basename(path)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Rendering core shared by the icon, screenshot and card scripts.
+
+  palette   brand colours, lerp_color and gradient stops (no Pillow)
+  shapes    circles, pills, row gradients and confetti on any draw (no Pillow)
+  canvas    canvas allocation and alpha flattening
+  gradient  vertical and diagonal gradients
+  text      cached fonts and text helpers
+  output    PNG writers
+  cli       command-line argument helpers (no Pillow)
+
+Submodules are loaded on first use. `import render_core` costs nothing, and
+`render_core.load_font` imports Pillow only when it is first looked up, so
+scripts that only need colours or target lists never load it.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'palette': ['VIOLET', 'VIOLET2', 'SKY', 'MINT', 'MINT2', 'CORAL', 'PEACH', 'GOLD',
+                'WHITE', 'DARK', 'GREY', 'LIGHT_BG', 'PALETTE', 'AURORA',
+                'lerp_color', 'stops_color'],
+    'shapes': ['circle', 'pill', 'row_gradient', 'draw_confetti'],
+    'canvas': ['new_canvas', 'canvas_draw', 'flatten', 'flatten_color'],
+    'gradient': ['draw_gradient_bg', 'gradient_bg_image', 'diagonal_field',
+                 'gradient_palette', 'colorize'],
+    'text': ['FONT_PATH', 'load_font', 'get_fonts', 'centered_text'],
+    'output': ['save_png', 'save_copies'],
+    'cli': ['parse_size'],
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_OF)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return importlib.import_module(f'{__name__}.{name}')
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULE_OF) | set(_EXPORTS))
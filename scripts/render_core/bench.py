@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark: import and first-render latency of the entry points.
+
+Every measurement runs in a fresh interpreter, so module caches, font caches
+and lru_caches start cold, as they do for a real CLI run. Both trees are
+byte-compiled first. With --baseline the same measurements run against a
+git revision of scripts/ extracted to a temporary directory.
+
+A faster import mostly means Pillow is loaded later, not less: the first
+render pays for it, so only the render cases measure end-to-end latency.
+
+Usage:
+  python scripts/render_core/bench.py [--runs 5] [--baseline HEAD~1]
+"""
+
+import argparse
+import compileall
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASE_DIR = os.path.dirname(SCRIPTS_DIR)
+
+# name → code run in a fresh interpreter; it prints its own timings as JSON
+CASES = {
+    'import screenshots': "import generate_screenshots",
+    'import icons': "import generate_app_icon",
+    'import build plan': "import build_assets",
+    'first screenshot': (
+        "import generate_screenshots as g\n"
+        "row = g.SCREENS[0]\n"
+        "g.render_screenshot(1290, 2796, *row[:3], *row[3:6])"
+    ),
+    'first icon master': "import generate_app_icon as ic\nic.variant_master(1024)",
+}
+
+HARNESS = """
+import json, time
+t = time.perf_counter()
+exec(compile({code!r}, 'case', 'exec'))
+print(json.dumps({{'seconds': time.perf_counter() - t}}))
+"""
+
+def measure(scripts_dir, code, runs):
+    """Median seconds of code over runs fresh interpreters, plus process wall time."""
+    inner, wall = [], []
+    env = dict(os.environ, PYTHONHASHSEED='0')
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, '-c', HARNESS.format(code=code)], cwd=scripts_dir,
+                             env=env, capture_output=True, text=True, check=True).stdout
+        wall.append(time.perf_counter() - start)
+        inner.append(json.loads(out.strip().splitlines()[-1])['seconds'])
+    return statistics.median(inner), statistics.median(wall)
+
+def extract_revision(rev, dest):
+    """Write scripts/ as of a git revision into dest; return its scripts dir."""
+    archive = subprocess.run(['git', '-C', BASE_DIR, 'archive', rev, 'scripts'],
+                             capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(dest)
+    return os.path.join(dest, 'scripts')
+
+def bench(trees, runs):
+    results = {}
+    for label, scripts_dir in trees.items():
+        compileall.compile_dir(scripts_dir, quiet=1)
+        results[label] = {}
+        for name, code in CASES.items():
+            try:
+                results[label][name] = measure(scripts_dir, code, runs)
+            except subprocess.CalledProcessError:
+                results[label][name] = None
+    return results
+
+def print_results(results, runs):
+    labels = list(results)
+    print(f"⏱️  Startup latency, median of {runs} fresh interpreter(s)\n")
+    print(f"  {'case':<20}" + ''.join(f" {label:>22}" for label in labels)
+          + ("  base÷new" if len(labels) == 2 else ""))
+    for name in CASES:
+        cells, values = [], []
+        for label in labels:
+            r = results[label][name]
+            values.append(r[0] if r else None)
+            cells.append(f"{r[0] * 1000:8.1f} ms ({r[1] * 1000:5.0f} wall)" if r else f"{'n/a':>22}")
+        line = f"  {name:<20}" + ''.join(f" {c:>22}" for c in cells)
+        if len(values) == 2 and all(values):
+            ratio = values[0] / values[1]
+            line += f"  {ratio:6.2f}×" + (" (slower)" if ratio < 1 else "")
+        print(line)
+    print("\n  Import cases only show where Pillow gets loaded; the render cases include")
+    print("  the import and are the end-to-end figures.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Import and first-render latency of the scripts.")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--baseline', default=None, help="git revision to compare against, e.g. HEAD~1")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trees = {}
+        if args.baseline:
+            trees[args.baseline] = extract_revision(args.baseline, tmp)
+        trees['working tree'] = SCRIPTS_DIR
+        print_results(bench(trees, args.runs), args.runs)
+
+if __name__ == '__main__':
+    main()
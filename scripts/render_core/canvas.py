@@ -0,0 +1,26 @@
+"""Canvas allocation and alpha flattening."""
+
+from PIL import Image, ImageDraw
+
+from .palette import WHITE
+
+def new_canvas(size, color=WHITE, mode='RGB', blend=True):
+    """(image, draw) for a new canvas; blend=False draws replace pixels, alpha included."""
+    img = Image.new(mode, size, color)
+    return img, canvas_draw(img, blend)
+
+def canvas_draw(img, blend=True):
+    return ImageDraw.Draw(img, 'RGBA') if blend else ImageDraw.Draw(img)
+
+def flatten(img, bg=WHITE):
+    """RGB copy of an image composited onto bg through its alpha (the App Store forbids alpha)."""
+    out = Image.new('RGB', img.size, bg)
+    out.paste(img, mask=img.getchannel('A') if img.mode == 'RGBA' else None)
+    return out
+
+def flatten_color(color, bg=WHITE):
+    """Opaque colour an RGBA fill ends up as once flattened onto bg."""
+    if len(color) < 4:
+        return color
+    a = color[3] / 255
+    return tuple(round(color[i] * a + bg[i] * (1 - a)) for i in range(3))
@@ -0,0 +1,6 @@
+"""Command-line argument helpers shared by the scripts. No Pillow import."""
+
+def parse_size(value):
+    """'WxH' → (w, h); argparse reports the ValueError of a malformed size."""
+    w, h = value.lower().split('x')
+    return int(w), int(h)
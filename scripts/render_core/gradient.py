@@ -0,0 +1,37 @@
+"""Vertical background gradients and palette-coloured diagonal gradients."""
+
+from PIL import Image, ImageChops
+
+from .palette import stops_color
+
+def draw_gradient_bg(draw, w, h, c1, c2, c3=None):
+    """Vertical gradient drawn one line per row."""
+    for y in range(h):
+        draw.line([(0, y), (w, y)], fill=stops_color((c1, c2, c3), y / h))
+
+def gradient_bg_image(w, h, c1, c2, c3=None):
+    """Same gradient as draw_gradient_bg, built as one column stretched to full width."""
+    column = Image.new('RGB', (1, h))
+    column.putdata([stops_color((c1, c2, c3), y / h) for y in range(h)])
+    return column.resize((w, h), Image.NEAREST)
+
+def diagonal_field(size, wx=0.6, wy=0.4):
+    """Diagonal progress (wx·x + wy·y) as an 'L' image, 255 = end of the gradient."""
+    xs = Image.new('L', (size, 1))
+    xs.putdata([round(x / size * wx * 255) for x in range(size)])
+    ys = Image.new('L', (1, size))
+    ys.putdata([round(y / size * wy * 255) for y in range(size)])
+    return ImageChops.add(xs.resize((size, size), Image.NEAREST), ys.resize((size, size), Image.NEAREST))
+
+def gradient_palette(stops):
+    """256-entry RGB palette of the gradient, indexed by progress."""
+    lut = []
+    for i in range(256):
+        lut.extend(stops_color(stops, i / 255))
+    return lut
+
+def colorize(field, stops):
+    """Colour a progress field with gradient stops via a 256-entry palette."""
+    img = field.copy()
+    img.putpalette(gradient_palette(stops))
+    return img.convert('RGB')
@@ -0,0 +1,18 @@
+"""PNG writers."""
+
+import os
+import shutil
+
+def save_png(img, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    img.save(path, 'PNG')
+    return path
+
+def save_copies(img, paths):
+    """Encode once to the first path and copy the file to the rest."""
+    first, *rest = paths
+    save_png(img, first)
+    for path in rest:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        shutil.copyfile(first, path)
+    return paths
@@ -0,0 +1,34 @@
+"""Brand colours and colour interpolation. No Pillow import."""
+
+VIOLET  = (124,  92, 252)
+VIOLET2 = ( 99,  69, 228)
+SKY     = (103, 195, 243)
+MINT    = (110, 231, 183)
+MINT2   = ( 52, 211, 153)
+CORAL   = (255, 107, 138)
+PEACH   = (255, 176, 136)
+GOLD    = (251, 191,  36)
+WHITE   = (255, 255, 255)
+DARK    = ( 26,  26,  46)
+GREY    = (107, 114, 128)
+LIGHT_BG= (248, 247, 252)
+
+PALETTE = {
+    'VIOLET': VIOLET, 'VIOLET2': VIOLET2, 'SKY': SKY, 'MINT': MINT, 'MINT2': MINT2,
+    'CORAL': CORAL, 'PEACH': PEACH, 'GOLD': GOLD, 'WHITE': WHITE, 'DARK': DARK,
+    'GREY': GREY, 'LIGHT_BG': LIGHT_BG,
+}
+
+AURORA = (VIOLET, SKY, MINT)   # the app's signature gradient
+
+def lerp_color(c1, c2, t):
+    """Linearly interpolate between two RGB colours; t is clamped to [0, 1]."""
+    t = max(0, min(1, t))
+    return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3))
+
+def stops_color(stops, t):
+    """Colour at t along two or three evenly spaced stops (a None third stop is ignored)."""
+    c1, c2, c3 = (tuple(stops) + (None,))[:3]
+    if c3:
+        return lerp_color(c1, c2, t * 2) if t < 0.5 else lerp_color(c2, c3, (t - 0.5) * 2)
+    return lerp_color(c1, c2, t)
@@ -0,0 +1,46 @@
+"""Shape primitives that work on any draw (ImageDraw or a recording). No Pillow import."""
+
+import random
+
+from .palette import CORAL, VIOLET, GOLD, MINT2, SKY, PEACH, lerp_color
+
+def circle(draw, cx, cy, r, **kwargs):
+    """Ellipse of radius r around (cx, cy); kwargs go to draw.ellipse."""
+    draw.ellipse([cx - r, cy - r, cx + r, cy + r], **kwargs)
+
+def pill(draw, box, **kwargs):
+    """Rounded rectangle with fully rounded ends."""
+    draw.rounded_rectangle(box, radius=(box[3] - box[1]) // 2, **kwargs)
+
+def row_gradient(draw, x0, y0, x1, rows, c1, c2, end=1.0):
+    """Vertical gradient from c1 to lerp(c1, c2, end), one rectangle per row.
+
+    A recording draw is told which colour pair and position every row
+    colour comes from, so themes re-colour the rows from that pair.
+    """
+    last = lerp_color(c1, c2, end)
+    note = getattr(draw, 'note_gradient', None)
+    for row in range(rows):
+        t = row / rows
+        fill = lerp_color(c1, last, t)
+        if note:
+            note(fill, c1, c2, t * end)
+        draw.rectangle([x0, y0 + row, x1, y0 + row + 1], fill=fill)
+
+def draw_confetti(draw, w, h, seed=42):
+    rng = random.Random(seed)
+    colors = [CORAL, VIOLET, GOLD, MINT2, SKY, PEACH]
+    for _ in range(90):
+        x = rng.randint(0, w)
+        y = rng.randint(0, int(h * 0.20))
+        r = rng.randint(4, 14)
+        c = rng.choice(colors)
+        if rng.random() > 0.5:
+            draw.ellipse([x - r, y - r, x + r, y + r], fill=c)
+        else:
+            draw.rectangle([x, y, x + r * 2, y + r], fill=c)
+    for _ in range(50):
+        x = rng.randint(0, w)
+        y = rng.randint(int(h * 0.86), h)
+        r = rng.randint(3, 10)
+        draw.ellipse([x - r, y - r, x + r, y + r], fill=rng.choice(colors))
@@ -0,0 +1,23 @@
+"""Cached fonts and text helpers."""
+
+from PIL import ImageFont
+from functools import lru_cache
+
+FONT_PATH = "/System/Library/Fonts/Helvetica.ttc"
+
+@lru_cache(maxsize=128)
+def load_font(px):
+    try:
+        return ImageFont.truetype(FONT_PATH, px)
+    except:
+        return ImageFont.load_default()
+
+@lru_cache(maxsize=32)
+def get_fonts(h):
+    """(hero, title, body, small, tiny) fonts for a screen of height h."""
+    return tuple(load_font(int(h * s)) for s in (0.055, 0.038, 0.024, 0.018, 0.013))
+
+def centered_text(draw, text, y, total_w, font, color):
+    bbox = draw.textbbox((0, 0), text, font=font)
+    tw = bbox[2] - bbox[0]
+    draw.text(((total_w - tw) // 2, y), text, fill=color, font=font)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Concurrent load check for render_service.py: latency percentiles under load.
+
+Opens --concurrency keep-alive connections and sends --requests POST /render
+requests across them. A --unique fraction of the requests carry a headline
+no other request uses (cache misses); the rest repeat a small set of
+screens and share cards, so they exercise the cache and in-flight
+coalescing. Prints throughput and p50/p90/p99/max latency, overall and per
+X-Cache result (hit, miss, coalesced).
+
+Usage:
+  python scripts/render_load.py [--spawn] [--port 8765] [--requests 400]
+      [--concurrency 16] [--unique 0.2] [--size 645x1398] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+from render_service import SCREEN_SPECS
+from render_core.cli import parse_size
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCREENS = sorted(SCREEN_SPECS)
+
+def make_requests(count, unique, size, seed=27):
+    """The request bodies, in send order."""
+    rng = random.Random(seed)
+    shared = [{'screen': s, 'size': size} for s in SCREENS]
+    shared += [{'screen': 'share_card', 'size': size, 'strings': {'name': n, 'age': a}}
+               for n, a in (("Mamma", 60), ("Pappa", 65), ("Elsa", 30))]
+    bodies = []
+    for i in range(count):
+        if rng.random() < unique:
+            bodies.append({'screen': rng.choice(SCREENS), 'size': size,
+                           'strings': {'headline': f"Test {i}"}})
+        else:
+            bodies.append(rng.choice(shared))
+    return [json.dumps(b).encode('utf-8') for b in bodies]
+
+async def post(reader, writer, body):
+    """Send one request on a keep-alive connection; return (status, X-Cache)."""
+    writer.write(b"POST /render HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 + f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    await reader.readexactly(int(headers.get('content-length', 0)))
+    return status, headers.get('x-cache', 'error')
+
+async def client(host, port, queue, results):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while not queue.empty():
+            body = queue.get_nowait()
+            start = time.perf_counter()
+            status, source = await post(reader, writer, body)
+            results.append((time.perf_counter() - start, status, source))
+    finally:
+        writer.close()
+
+async def run_load(host, port, bodies, concurrency):
+    queue = asyncio.Queue()
+    for body in bodies:
+        queue.put_nowait(body)
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, queue, results) for _ in range(concurrency)))
+    return results, time.perf_counter() - start
+
+def percentiles(seconds):
+    ms = sorted(s * 1000 for s in seconds)
+    if len(ms) < 2:
+        return ms * 4
+    q = statistics.quantiles(ms, n=100, method='inclusive')
+    return q[49], q[89], q[98], ms[-1]
+
+def print_results(results, wall, concurrency):
+    errors = sum(1 for _, status, _ in results if status != 200)
+    print(f"📈 {len(results)} requests · {concurrency} connections · {wall:.1f}s · "
+          f"{len(results) / wall:.1f} req/s · {errors} error(s)\n")
+    print(f"  {'':<10} {'count':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    groups = {'all': [r[0] for r in results]}
+    for seconds, _, source in results:
+        groups.setdefault(source, []).append(seconds)
+    for name, seconds in groups.items():
+        cells = ''.join(f" {v:6.1f} ms" for v in percentiles(seconds))
+        print(f"  {name:<10} {len(seconds):>6}{cells}")
+
+def wait_for(host, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            asyncio.run(asyncio.wait_for(asyncio.open_connection(host, port), 1))
+            return
+        except (OSError, asyncio.TimeoutError):
+            time.sleep(0.2)
+    raise SystemExit(f"render service did not come up on {host}:{port}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency percentiles of the render service under load.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--unique', type=float, default=0.2, help="fraction of cache-missing requests")
+    parser.add_argument('--size', type=parse_size, default=(645, 1398), help="WxH, default 645x1398")
+    parser.add_argument('--spawn', action='store_true', help="start render_service.py for the run")
+    parser.add_argument('--workers', type=int, default=None, help="service workers with --spawn")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        cmd = [sys.executable, os.path.join(SCRIPTS_DIR, 'render_service.py'),
+               '--host', args.host, '--port', str(args.port)]
+        if args.workers:
+            cmd += ['--workers', str(args.workers)]
+        server = subprocess.Popen(cmd, cwd=SCRIPTS_DIR, stdout=subprocess.DEVNULL)
+    try:
+        wait_for(args.host, args.port)
+        bodies = make_requests(args.requests, args.unique, args.size)
+        results, wall = asyncio.run(run_load(args.host, args.port, bodies, args.concurrency))
+        print_results(results, wall, args.concurrency)
+    finally:
+        if server:
+            # SIGINT, so the service shuts its worker pool down with it
+            server.send_signal(signal.SIGINT)
+            server.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Local render service for screenshots and share cards.
+
+Serves the `screen_*` screenshot renderer and the share-card renderer over a
+small asyncio HTTP/1.1 server so tooling can request images on demand instead
+of running a script per image.
+
+  POST /render   JSON body → image/png or image/webp
+  GET  /health   cache and in-flight statistics as JSON
+
+Request body:
+  {
+    "screen":  "home" | "screen_home" | ... | "share_card",
+    "size":    "iphone_67" | [1290, 2796],
+    "strings": {"headline": "...", "subline": "..."}      (screens)
+               {"name": "Mamma", "age": 60, "date": "21 februari"} (share_card),
+    "palette": ["#7C5CFC", [103, 195, 243], "#6EE7B7"],   (optional)
+    "format":  "png" | "webp"                              (optional)
+  }
+
+Rendering runs in a process pool; identical in-flight requests share one
+render, and finished images are kept in an LRU cache bounded by bytes. The
+per-size layer and font caches in the workers are bounded too, so clients
+cycling through sizes can't grow a worker without limit.
+render_load.py measures latency percentiles against it under concurrent load.
+
+Usage:
+  python scripts/render_service.py [--host 127.0.0.1] [--port 8765]
+      [--workers 4] [--cache-mb 256]
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import os
+import time
+
+from generate_screenshots import SCREENS, SIZES, render_screenshot
+from generate_share_cards import render_card
+
+MAX_SIDE = 4096
+MAX_BODY = 64 * 1024
+FORMATS = {'png': ('PNG', 'image/png'), 'webp': ('WEBP', 'image/webp')}
+SCREEN_SPECS = {func.__name__[len('screen_'):]: (headline, subline, func, (c1, c2, c3))
+                for headline, subline, func, c1, c2, c3, _ in SCREENS}
+STATUS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+          413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class BadRequest(ValueError):
+    pass
+
+# ── Request normalization ──────────────────────────────────
+
+def parse_color(value):
+    if isinstance(value, str):
+        value = value.lstrip('#')
+        try:
+            if len(value) != 6:
+                raise ValueError
+            return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+        except ValueError:
+            raise BadRequest(f"bad colour: #{value}")
+    if (not isinstance(value, (list, tuple)) or len(value) != 3
+            or not all(isinstance(c, int) and not isinstance(c, bool) and 0 <= c <= 255 for c in value)):
+        raise BadRequest(f"bad colour: {value}")
+    return tuple(value)
+
+def normalize(req):
+    """Validate a render request and fill in defaults; the result is the cache key source."""
+    if not isinstance(req, dict):
+        raise BadRequest("body must be a JSON object")
+    screen = str(req.get('screen', '')).removeprefix('screen_')
+    if screen != 'share_card' and screen not in SCREEN_SPECS:
+        raise BadRequest(f"unknown screen: {screen!r}")
+
+    size = req.get('size', 'iphone_67')
+    if isinstance(size, str):
+        if size not in SIZES:
+            raise BadRequest(f"unknown size: {size!r}")
+        size = SIZES[size]
+    try:
+        if any(isinstance(v, bool) for v in size):
+            raise TypeError
+        w, h = (int(v) for v in size)
+    except (TypeError, ValueError):
+        raise BadRequest("size must be a device name or [width, height]")
+    if not (0 < w <= MAX_SIDE and 0 < h <= MAX_SIDE):
+        raise BadRequest(f"size must be within 1..{MAX_SIDE}")
+
+    fmt = req.get('format', 'png')
+    if fmt not in FORMATS:
+        raise BadRequest(f"format must be one of {sorted(FORMATS)}")
+
+    strings = req.get('strings') or {}
+    if not isinstance(strings, dict):
+        raise BadRequest("strings must be an object")
+    spec = {'screen': screen, 'size': [w, h], 'format': fmt}
+    if screen == 'share_card':
+        age = strings.get('age')
+        try:
+            if isinstance(age, bool):
+                raise TypeError
+            age = int(age) if age not in (None, '') else None
+        except (TypeError, ValueError):
+            raise BadRequest(f"age must be a whole number: {age!r}")
+        date = str(strings.get('date') or '').strip()
+        if age is None and not date:
+            raise BadRequest("share_card needs strings.age or strings.date")
+        spec['strings'] = {'name': str(strings.get('name', '')), 'age': age, 'date': date}
+    else:
+        headline, subline, _, palette = SCREEN_SPECS[screen]
+        spec['strings'] = {'headline': str(strings.get('headline', headline)),
+                           'subline': str(strings.get('subline', subline))}
+        palette = req.get('palette') or palette
+        if not isinstance(palette, (list, tuple)) or len(palette) != 3:
+            raise BadRequest("palette must have three colours")
+        spec['palette'] = [parse_color(c) for c in palette]
+    return spec
+
+def cache_key(spec):
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+
+# ── Rendering (runs in worker processes) ───────────────────
+
+def render_spec(spec):
+    """Render a normalized request and return the encoded image bytes."""
+    w, h = spec['size']
+    s = spec['strings']
+    if spec['screen'] == 'share_card':
+        img = render_card(s['name'], s['age'], s['date'], w, h)
+    else:
+        func = SCREEN_SPECS[spec['screen']][2]
+        c1, c2, c3 = spec['palette']
+        img = render_screenshot(w, h, s['headline'], s['subline'], func, c1, c2, c3)
+    buf = io.BytesIO()
+    img.save(buf, FORMATS[spec['format']][0])
+    return buf.getvalue()
+
+# ── Cache & coalescing ─────────────────────────────────────
+
+class ByteLRU:
+    """LRU mapping of key → bytes, evicting oldest entries past max_bytes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.items = OrderedDict()
+
+    def get(self, key):
+        data = self.items.get(key)
+        if data is not None:
+            self.items.move_to_end(key)
+        return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        old = self.items.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old)
+        self.items[key] = data
+        self.bytes += len(data)
+        while self.bytes > self.max_bytes:
+            _, evicted = self.items.popitem(last=False)
+            self.bytes -= len(evicted)
+
+
+class RenderService:
+    def __init__(self, workers, cache_bytes):
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.cache = ByteLRU(cache_bytes)
+        self.inflight = {}
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0}
+
+    async def render(self, spec):
+        """Return (image bytes, 'hit' | 'miss' | 'coalesced')."""
+        key = cache_key(spec)
+        data = self.cache.get(key)
+        if data is not None:
+            self.stats['hits'] += 1
+            return data, 'hit'
+        pending = self.inflight.get(key)
+        if pending is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(pending), 'coalesced'
+
+        self.stats['misses'] += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.pool, render_spec, spec)
+        self.inflight[key] = future
+        try:
+            data = await asyncio.shield(future)
+        finally:
+            del self.inflight[key]
+        self.cache.put(key, data)
+        return data, 'miss'
+
+    def health(self):
+        return {**self.stats, 'inflight': len(self.inflight),
+                'cache_entries': len(self.cache.items), 'cache_bytes': self.cache.bytes,
+                'cache_max_bytes': self.cache.max_bytes}
+
+    # ── HTTP ───────────────────────────────────────────────
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode('latin-1').split(None, 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY:
+                    await self.respond(writer, 413, b'', close=True)
+                    break
+                body = await reader.readexactly(length) if length else b''
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.strip() == 'HTTP/1.1')
+                await self.dispatch(writer, method, path, body, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, writer, method, path, body, keep_alive):
+        if path == '/health':
+            await self.respond(writer, 200, json.dumps(self.health()).encode(),
+                               'application/json', close=not keep_alive)
+            return
+        if path != '/render':
+            await self.respond(writer, 404, b'', close=not keep_alive)
+            return
+        if method != 'POST':
+            await self.respond(writer, 405, b'', close=not keep_alive)
+            return
+        start = time.perf_counter()
+        try:
+            spec = normalize(json.loads(body or b'null'))
+            data, source = await self.render(spec)
+        except (BadRequest, json.JSONDecodeError) as e:
+            self.stats['errors'] += 1
+            await self.respond(writer, 400, json.dumps({'error': str(e)}).encode(),
+                               'application/json', close=not keep_alive)
+            return
+        except Exception as e:
+            self.stats['errors'] += 1
+            await self.respond(writer, 500, json.dumps({'error': repr(e)}).encode(),
+                               'application/json', close=not keep_alive)
+            return
+        ms = (time.perf_counter() - start) * 1000
+        await self.respond(writer, 200, data, FORMATS[spec['format']][1], close=not keep_alive,
+                           extra={'X-Cache': source, 'X-Render-Ms': f"{ms:.1f}"})
+
+    async def respond(self, writer, status, body, content_type='text/plain', close=False, extra=None):
+        head = [f"HTTP/1.1 {status} {STATUS[status]}",
+                f"Content-Type: {content_type}",
+                f"Content-Length: {len(body)}",
+                f"Connection: {'close' if close else 'keep-alive'}"]
+        head += [f"{k}: {v}" for k, v in (extra or {}).items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(host, port, workers, cache_bytes):
+    service = RenderService(workers, cache_bytes)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"🖼  Render service on http://{host}:{port}  "
+          f"({workers} workers, {cache_bytes // (1024 * 1024)} MB cache)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.pool.shutdown(cancel_futures=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Local screenshot / share-card render service.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--cache-mb', type=int, default=256)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.cache_mb * 1024 * 1024))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+"""
+Theme variants (dark mode, seasonal palettes) for icons and screenshots.
+
+A render is recorded once with `RecordingDraw`, which captures every drawing
+call with its final geometry and text layout. `rasterize` turns the calls
+into coverage masks once, text included; each theme then only pastes its
+resolved colours through those masks (`paste_layers`). `replay` re-issues
+the calls instead, for canvases where fills replace pixels. Colours are
+matched against the base palette by value; row gradient colours are
+re-interpolated between the themed pair they were drawn from, and other
+in-between colours between the best-fitting palette pair.
+
+Pillow is only imported by `rasterize`, so build plans can list themes
+without loading it.
+"""
+
+from functools import lru_cache
+
+from render_core.palette import WHITE, lerp_color
+
+# Base palette names → replacement RGB; unlisted names keep their base colour.
+# colors:   raw RGB → RGB for the neutral greys the screens use directly.
+# surface:  replaces translucent white rectangle fills (cards); text keeps its colour.
+# bg_shade: (colour, amount) the background gradient stops are mixed towards.
+THEMES = {
+    'light': {},
+    'dark': {
+        'palette': {
+            'LIGHT_BG': ( 22,  22,  34),
+            'DARK':     (236, 236, 245),
+            'GREY':     (160, 166, 180),
+        },
+        'colors': {
+            (240, 238, 255): ( 52,  44,  92),
+            (230, 230, 235): ( 60,  60,  74),
+            (200, 200, 210): ( 80,  80,  96),
+            (190, 190, 200): ( 90,  90, 105),
+            ( 18,  18,  28): (  4,   4,   8),
+        },
+        'surface': (38, 38, 56),
+        'bg_shade': ((10, 10, 22), 0.55),
+    },
+    'jul': {
+        'palette': {
+            'VIOLET':  (180,  30,  50),
+            'VIOLET2': (150,  20,  40),
+            'SKY':     ( 30, 120,  80),
+            'MINT':    (220, 235, 225),
+            'MINT2':   ( 20, 140,  90),
+            'CORAL':   (210,  40,  60),
+            'PEACH':   (240, 170, 120),
+            'GOLD':    (240, 190,  60),
+        },
+    },
+    'midsommar': {
+        'palette': {
+            'VIOLET':  (  0, 106, 167),
+            'VIOLET2': (  0,  82, 140),
+            'SKY':     (120, 190, 235),
+            'MINT':    (254, 220,  80),
+            'MINT2':   ( 80, 170,  90),
+            'CORAL':   (240, 120, 150),
+            'PEACH':   (255, 200, 120),
+            'GOLD':    (254, 204,   2),
+        },
+    },
+}
+
+THEME_NAMES = list(THEMES)
+
+# Draw calls whose translucent white fill is a card surface
+SURFACE_OPS = ('rectangle', 'rounded_rectangle')
+# Draw calls stamped through a coverage mask; Pillow ignores their ink alpha
+MASK_OPS = ('text', 'multiline_text', 'bitmap')
+
+def _fit(rgb, a, b):
+    """(error, t) of the closest point to rgb on a → b, or None outside (0, 1)."""
+    d = [b[i] - a[i] for i in range(3)]
+    dd = sum(v * v for v in d)
+    if not dd:
+        return None
+    t = sum((rgb[i] - a[i]) * d[i] for i in range(3)) / dd
+    if not 0 < t < 1:
+        return None
+    return max(abs(a[k] + d[k] * t - rgb[k]) for k in range(3)), t
+
+@lru_cache(maxsize=None)
+def _segment_of(rgb, anchors):
+    """(a, b, t) for the anchor pair that fits rgb best – shared by all themes.
+
+    Only a guess for colours no gradient was recorded for: near an anchor,
+    several pairs can fit within rounding.
+    """
+    best = None
+    for i, a in enumerate(anchors):
+        for b in anchors[i + 1:]:
+            fit = _fit(rgb, a, b)
+            if fit and fit[0] <= 1.5 and (best is None or fit[0] < best[0]):
+                best = (fit[0], a, b, fit[1])
+    return best[1:] if best else None
+
+def make_resolver(theme, base_palette, surfaces=True, segments=None):
+    """Return resolve(colour, op=None) → themed colour for one theme.
+
+    base_palette maps palette names to their base RGB. op is the draw call
+    a fill belongs to; only SURFACE_OPS fills take the theme's surface.
+    segments maps gradient colours to the (a, b, t) they were drawn from
+    (`RecordingDraw.segments`); other in-between colours are matched to the
+    best-fitting palette pair. Results are memoized, so each distinct colour
+    is resolved once per theme.
+    """
+    segments = segments or {}
+    overrides = theme.get('palette', {})
+    mapping = {rgb: overrides.get(name, rgb) for name, rgb in base_palette.items()}
+    mapping.update(theme.get('colors', {}))
+    anchors = tuple(base_palette.values())
+    surface = theme.get('surface') if surfaces else None
+    cache = {}
+
+    def resolve(color, op=None):
+        key = (color, op in SURFACE_OPS)
+        if key in cache:
+            return cache[key]
+        rgb, alpha = tuple(color[:3]), tuple(color[3:])
+        if surface and key[1] and rgb == WHITE and alpha and alpha[0] < 255:
+            out = (*surface, *alpha)
+        elif rgb in mapping:
+            out = (*mapping[rgb], *alpha)
+        else:
+            out = color
+            seg = segments.get(rgb) or _segment_of(rgb, anchors)
+            if seg:
+                a, b, t = seg
+                ta, tb = mapping.get(a, a), mapping.get(b, b)
+                if ta != a or tb != b:
+                    out = (*lerp_color(ta, tb, t), *alpha)
+        cache[key] = out
+        return out
+
+    return resolve
+
+def background_stops(theme, stops, resolve):
+    """Themed background gradient stops."""
+    shade = theme.get('bg_shade')
+    stops = [resolve(c) if c else c for c in stops]
+    if shade:
+        stops = [lerp_color(c, shade[0], shade[1]) if c else c for c in stops]
+    return stops
+
+
+class RecordingDraw:
+    """Stand-in for ImageDraw.Draw that records drawing calls for replay.
+
+    Measurement calls are answered right away by `measure` (a real
+    ImageDraw on any image), so layout decisions happen during recording.
+    Gradient helpers report where their row colours come from through
+    `note_gradient`; the result is passed to make_resolver as segments.
+    """
+
+    MEASURE = ('textbbox', 'textlength', 'multiline_textbbox')
+
+    def __init__(self, measure):
+        self._measure = measure
+        self.ops = []
+        self.segments = {}
+
+    def note_gradient(self, rgb, a, b, t):
+        """Record that rgb was drawn at t between colours a and b."""
+        self.segments.setdefault(tuple(rgb[:3]), (tuple(a[:3]), tuple(b[:3]), t))
+
+    def __getattr__(self, name):
+        if name in self.MEASURE:
+            return getattr(self._measure, name)
+
+        def record(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+        return record
+
+def replay(ops, draw, resolve):
+    """Re-issue recorded calls on a real draw with fill/outline resolved."""
+    for name, args, kwargs in ops:
+        for key in ('fill', 'outline'):
+            if isinstance(kwargs.get(key), tuple):
+                kwargs = {**kwargs, key: resolve(kwargs[key], name if key == 'fill' else None)}
+        getattr(draw, name)(*args, **kwargs)
+
+def _extent(draw, name, args, kwargs, size):
+    """Box that contains everything a recorded call can touch, clipped to size."""
+    xy = args[0] if args else kwargs.get('xy')
+    if name in ('text', 'multiline_text'):
+        measure = draw.textbbox if name == 'text' else draw.multiline_textbbox
+        box = measure(xy, args[1] if len(args) > 1 else kwargs['text'],
+                      **{k: v for k, v in kwargs.items() if k in ('font', 'anchor', 'spacing', 'align')})
+    elif name == 'bitmap':
+        w, h = (args[1] if len(args) > 1 else kwargs['bitmap']).size
+        box = (xy[0], xy[1], xy[0] + w, xy[1] + h)
+    else:
+        flat = []
+        for v in xy:
+            flat.extend(v) if isinstance(v, (tuple, list)) else flat.append(v)
+        box = (min(flat[0::2]), min(flat[1::2]), max(flat[0::2]), max(flat[1::2]))
+    pad = int(kwargs.get('width') or 1) + 2
+    return (max(0, int(box[0]) - pad), max(0, int(box[1]) - pad),
+            min(size[0], int(box[2]) + pad + 1), min(size[1], int(box[3]) + pad + 1))
+
+def rasterize(ops, size):
+    """Coverage layers [(op, key, colour, box, mask)] of recorded calls, in draw order.
+
+    Each fill and outline is drawn once into an 'L' scratch canvas at the
+    alpha it composites with (its colour's alpha; full for MASK_OPS) and
+    cropped to its bounding box. Opaque shapes are never anti-aliased, so
+    their masks are kept as '1', which pastes about ten times faster.
+    Consecutive opaque calls of the same colour share one layer. Painting the layers in order over a background gives
+    the same image as the calls on a blending draw.
+    """
+    from PIL import Image, ImageDraw
+    scratch = Image.new('L', size, 0)
+    draw = ImageDraw.Draw(scratch)
+    layers = []
+    pending = extent = None
+
+    def flush():
+        nonlocal pending
+        x0, y0, x1, y1 = extent
+        box = scratch.crop(extent).getbbox() if x1 > x0 and y1 > y0 else None
+        if box:
+            box = (box[0] + x0, box[1] + y0, box[2] + x0, box[3] + y0)
+            mask = scratch.crop(box)
+            name, _, color = pending
+            if name not in MASK_OPS and color[3:] in ((), (255,)):
+                mask = mask.convert('1', dither=Image.Dither.NONE)
+            layers.append((*pending, box, mask))
+            scratch.paste(0, extent)
+        pending = None
+
+    for name, args, kwargs in ops:
+        for key in ('fill', 'outline'):
+            color = kwargs.get(key)
+            if not isinstance(color, tuple):
+                continue
+            alpha = color[3] if len(color) > 3 and name not in MASK_OPS else 255
+            if pending is not None and (alpha < 255 or pending != (name, key, color)):
+                flush()
+            e = _extent(draw, name, args, kwargs, size)
+            extent = e if pending is None else (min(extent[0], e[0]), min(extent[1], e[1]),
+                                                max(extent[2], e[2]), max(extent[3], e[3]))
+            pending = (name, key, color)
+            kw = {**kwargs, key: alpha}
+            other = 'outline' if key == 'fill' else 'fill'
+            if other in kw:
+                kw[other] = None
+            getattr(draw, name)(*args, **kw)
+            if alpha < 255:
+                flush()
+    if pending is not None:
+        flush()
+    return layers
+
+def paste_layers(img, layers, resolve):
+    """Paint rasterized layers onto img in their resolved colours."""
+    for name, key, color, box, mask in layers:
+        img.paste(resolve(color, name if key == 'fill' else None)[:3], box, mask)